@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Measures FocusCLI._parse_file on synthetic ledgers of growing size.
+
+The generated ledger mimics a long day: every round adds a few tasks with
+subtasks in a Free Write block, resolves one task and then checkpoints the
+whole stack under a Triage marker. The stack therefore grows with the file,
+which is the case that used to make parsing quadratic.
+
+Each size is run twice: with plain Triage markers, which are replayed from
+the start of the file, and with Triage Checkpoint markers, where a cold parse
+only replays from the last checkpoint.
+
+Usage: python3 benchmarks/bench_parse.py [max_lines]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+def generate_ledger(path, target_lines, label="Triage"):
+    stack = []
+    written = 0
+    round_no = 0
+    with open(path, 'w') as f:
+        while written < target_lines:
+            round_no += 1
+            f.write(f"\n------- Free Write 01/01/2026 09:00:00 AM -------\n\n")
+            written += 3
+            for i in range(5):
+                task = (f"Task {round_no}.{i}", [f"[] Step {round_no}.{i}.a", f"[] Step {round_no}.{i}.b"])
+                stack.append(task)
+                f.write(f"[] {task[0]}\n")
+                for n in task[1]:
+                    f.write(f"  {n}\n")
+                written += 3
+            done = stack.pop(round_no % len(stack))
+            f.write(f"\n------- Task Completed 01/01/2026 09:00:00 AM -------\n[x] {done[0]}\n")
+            written += 3
+            f.write(f"\n------- {label} 01/01/2026 09:00:00 AM -------\n")
+            written += 2
+            for content, notes in stack:
+                f.write(f"[] {content}\n")
+                for n in notes:
+                    f.write(f"  {n}\n")
+                written += 1 + len(notes)
+    return written, len(stack)
+
+def main():
+    max_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sizes = [max_lines // 8, max_lines // 4, max_lines // 2, max_lines]
+
+    print(f"{'marker':>17} {'lines':>8} {'stack':>6} {'seconds':>9} {'us/line':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ["Triage", "Triage Checkpoint"]:
+            for size in sizes:
+                path = os.path.join(tmp, f"bench-{len(label)}-{size}.txt")
+                lines, stack_size = generate_ledger(path, size, label)
+                cli = FocusCLI()
+                start = time.perf_counter()
+                cli._parse_file(path)
+                elapsed = time.perf_counter() - start
+                print(f"{label:>17} {lines:>8} {stack_size:>6} {elapsed:>9.3f} {elapsed / lines * 1e6:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Measures peak traced memory of a cold ledger parse, before and after mmap reading.
+
+The parsers used to read the whole unparsed tail and split it into a list of
+decoded lines before replaying it. They now walk a memory-mapped file with
+ledgerio, decoding one line at a time, so peak memory follows the size of the
+parsed state rather than the size of the file. The scorecard pass is shown
+because it replays every line of the file.
+
+Usage: python3 benchmarks/bench_parse_memory.py [max_lines]
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import focuscli
+import ledgerio
+from focuscli import FocusCLI
+from bench_parse import generate_ledger
+
+def read_all_lines(path):
+    """The previous approach: read the file and decode every line up front."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Markers stay bytes, as the parsers expect them from ledgerio.iter_text_lines
+    lines = [l.rstrip() if ledgerio.MARKER in l else l.decode('utf-8', errors='replace').rstrip() for l in data.split(b'\n')]
+    if data.endswith(b'\n'):
+        lines.pop()
+    return lines
+
+def traced(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def main():
+    max_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sizes = [max_lines // 4, max_lines // 2, max_lines]
+
+    print(f"{'lines':>8} {'approach':>10} {'peak KiB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"bench-{size}.txt")
+            lines, _ = generate_ledger(path, size)
+            focuscli.FILENAME = path
+
+            def old():
+                cli = FocusCLI()
+                cli._summarize_lines(read_all_lines(path), cli._new_summary_state())
+
+            def new():
+                cli = FocusCLI()
+                cli._save_parse_cache = lambda *args: None
+                cli.get_daily_summary()
+
+            for name, fn in [("readlines", old), ("mmap", new)]:
+                print(f"{lines:>8} {name:>10} {traced(fn) / 1024:>10.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Measures the main loop's per-tick redraw bookkeeping with a 500-note focus item.
+
+The loop used to keep a deepcopy of the top task after every redraw and
+compare it by value on every tick. It now compares FocusCLI.stack_version,
+which every mutation bumps.
+
+Usage: python3 benchmarks/bench_redraw_check.py
+"""
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+NOTES = 500
+ROUNDS = 2000
+
+def main():
+    cli = FocusCLI()
+    cli.triage_stack = [{'line': '[] Big task', 'notes': [f"  [] Step {i} with some detail" for i in range(NOTES)]}]
+
+    last_task = copy.deepcopy(cli.triage_stack[0])
+    last_version = cli.stack_version
+
+    def old_tick():
+        return cli.triage_stack[0] != last_task
+
+    def old_redraw():
+        return copy.deepcopy(cli.triage_stack[0])
+
+    def new_tick():
+        return cli.stack_version != last_version
+
+    results = [
+        ("tick (deep ==)", old_tick),
+        ("tick (version)", new_tick),
+        ("redraw (deepcopy)", old_redraw),
+        ("redraw (version)", lambda: cli.stack_version),
+    ]
+    print(f"Focus item with {NOTES} notes, {ROUNDS} rounds")
+    for name, fn in results:
+        seconds = min(timeit.repeat(fn, number=ROUNDS, repeat=5)) / ROUNDS
+        print(f"{name:>18}: {seconds * 1e6:10.3f} us")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Measures terminal bytes written while typing a task into the Triage prompt.
+
+Each keystroke triggers a redraw. The old renderer cleared the screen and
+reprinted the whole frame every time; ScreenBuffer diffs the new frame against
+the one on screen and rewrites only the rows that changed.
+
+Usage: python3 benchmarks/bench_render_bytes.py
+"""
+import contextlib
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+TYPED = "[] Review the quarterly planning document"
+
+class ByteCounter:
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, text):
+        self.bytes += len(text.encode('utf-8'))
+
+    def flush(self):
+        pass
+
+def type_task(full_redraw, stack_size=20):
+    cli = FocusCLI()
+    cli.triage_stack = [{'line': f"[] Task {i}", 'notes': [f"  Note for task {i}"]} for i in range(stack_size)]
+    counter = ByteCounter()
+    with contextlib.redirect_stdout(counter):
+        cli.draw_screen("", 0)
+        counter.bytes = 0
+        for i in range(1, len(TYPED) + 1):
+            if full_redraw:
+                cli.screen.invalidate()
+            cli.draw_screen(TYPED[:i], i)
+    return counter.bytes
+
+def main():
+    os.environ.setdefault('COLUMNS', '100')
+    os.environ.setdefault('LINES', '50')
+    full = type_task(full_redraw=True)
+    diff = type_task(full_redraw=False)
+    print(f"Typing {len(TYPED)} characters with 20 tasks on screen")
+    print(f"{'full redraw':>12}: {full:8d} bytes ({full / len(TYPED):7.1f}/key)")
+    print(f"{'diff':>12}: {diff:8d} bytes ({diff / len(TYPED):7.1f}/key)")
+    print(f"{'reduction':>12}: {full / diff:8.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Compares the per-command cost of snapshotting the stack for the 'w' dirty check.
+
+handle_command used to deepcopy the whole stack into initial_stack after most
+commands and compare it by value at 'w'. Snapshots now share the item dicts
+with the live stack, items changed in place are copied when they are touched,
+and the check returns at once when stack_version has not moved.
+
+Usage: python3 benchmarks/bench_snapshot.py
+"""
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+ROUNDS = 200
+
+def main():
+    for items in (100, 300, 1000):
+        cli = FocusCLI()
+        cli.triage_stack = [{'line': f"[] Task {i}", 'notes': [f"  Note {i}.{j}" for j in range(5)]} for i in range(items)]
+
+        deep = copy.deepcopy(cli.triage_stack)
+        snapshot = cli._snapshot_stack()
+        touched = (snapshot[0] - 1, snapshot[1], {}) # As if the stack had been reordered and restored since
+        # One item edited in place since the snapshot, as x# or a do
+        cli.initial_stack = edited = cli._snapshot_stack()
+        cli._touch_stack(cli.triage_stack[0])
+        clean = cli._snapshot_stack() # Nothing touched since
+        timings = {
+            'deepcopy': lambda: copy.deepcopy(cli.triage_stack),
+            'deep !=': lambda: cli.triage_stack != deep,
+            'snapshot': cli._snapshot_stack,
+            'check (clean)': lambda: cli._stack_changed_since(clean),
+            'check (touched)': lambda: cli._stack_changed_since(touched),
+            'check (one edit)': lambda: cli._stack_changed_since(edited),
+        }
+
+        print(f"{items} items x 5 notes")
+        for name, fn in timings.items():
+            seconds = min(timeit.repeat(fn, number=ROUNDS, repeat=3)) / ROUNDS
+            print(f"  {name:>16}: {seconds * 1e6:10.1f} us")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Counts main-loop wakeups per idle minute, before and after deadline scheduling.
+
+The old loop polled stdin every 100 ms regardless of state. The current loop
+sleeps until FocusCLI._next_wakeup_timeout says something is due; this script
+replays one simulated minute per scenario and counts those wakeups.
+
+Usage: python3 benchmarks/bench_wakeups.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+POLL_INTERVAL = 0.1 # The previous fixed select() timeout
+
+def count_wakeups(cli, start, seconds=60):
+    now = start
+    wakeups = 0
+    while now < start + seconds:
+        timeout = cli._next_wakeup_timeout(now)
+        if timeout is None:
+            break
+        now += timeout
+        wakeups += 1
+    return wakeups
+
+def scenario(mode, stack, focus_started):
+    cli = FocusCLI()
+    cli.mode = mode
+    cli.triage_stack = stack
+    start = time.time()
+    cli.focus_start_time = start if focus_started else None
+    if mode == "BREAK":
+        cli.break_start_time = start
+        cli.break_duration = 5
+    # Build the meeting schedule the way the loop does before sleeping
+    cli.check_meetings()
+    return cli, start
+
+def main():
+    tasks = [{'line': f'[] Task {i}', 'notes': []} for i in range(200)]
+    scenarios = [
+        ("Focus, 200 tasks", "FOCUS", tasks, True),
+        ("Break, 200 tasks", "BREAK", tasks, True),
+        ("Triage, focus timer running", "TRIAGE", tasks, True),
+        ("Triage before first focus", "TRIAGE", tasks, False),
+        ("Daily scorecard (exit)", "EXIT", [], False),
+    ]
+
+    print(f"{'scenario':<30} {'before':>8} {'after':>8}")
+    for label, mode, stack, focus_started in scenarios:
+        cli, start = scenario(mode, list(stack), focus_started)
+        before = int(60 / POLL_INTERVAL)
+        after = count_wakeups(cli, start)
+        print(f"{label:<30} {before:>8} {after:>8}")
+
+if __name__ == "__main__":
+    main()
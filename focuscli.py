@@ -4,26 +4,91 @@ import sys
 import re
 import time
 import logging
+import json
 import copy
+import functools
+import heapq
 import random
 import select
+import selectors
+import math
 import termios
 import tty
 import signal
 import subprocess
 import shlex
 import tempfile
+import shutil
+import sqlite3
+import contextlib
+import zlib
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
+import ledgerio
+import ledgerdb
+import searchindex
+import timetrack
+
+CLI_VALUE_OPTIONS = {'search', 'summary', 'time'} # --options that take the following argument as their value
+CLI_OPTIONAL_VALUE_OPTIONS = {'sync-db'} # --options that take the following argument unless it is an option or a .txt plan file
+
+def parse_cli_args(argv):
+    """Splits command line arguments into the plan file name (or None) and a dict of --options."""
+    filename = None
+    options = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg.startswith('--'):
+            name, has_value, value = arg[2:].partition('=')
+            if not has_value:
+                value = True
+                if name in CLI_VALUE_OPTIONS:
+                    value = argv[i] if i < len(argv) else ''
+                    i += 1
+                elif name in CLI_OPTIONAL_VALUE_OPTIONS and i < len(argv) and not argv[i].startswith('--') and not argv[i].endswith('.txt'):
+                    value = argv[i]
+                    i += 1
+            options[name] = value
+        elif filename is None:
+            filename = arg
+    return filename, options
+
 # --- CONFIG ---
 DATE_FORMAT = '%Y%m%d'
-FILENAME = sys.argv[1] if len(sys.argv) > 1 else datetime.now().strftime(f'{DATE_FORMAT}-plan.txt')
+CLI_FILENAME, CLI_OPTIONS = parse_cli_args(sys.argv[1:])
+FILENAME = CLI_FILENAME or datetime.now().strftime(f'{DATE_FORMAT}-plan.txt')
 LOG_FILE = "focus_activity.log"
 DEFAULT_FOCUS_THRESHOLD_MINS = 25
 ALERT_THRESHOLD = DEFAULT_FOCUS_THRESHOLD_MINS * 60
 CHIME_COMMAND = None # Set to a command string like "play /path/to/sound.wav" to override
+LEDGER_DURABILITY = "flush" # "none", "flush" or "fsync" ledger writes at the end of each command
+RESCUE_LOOKBACK_DAYS = 7 # Days of previous plan files scanned for pending tasks on the first launch of a day
+PARALLEL_MIN_FILES = 4 # Parse ledgers in a process pool (rescue, --summary, --time) when there are at least this many
+LEDGER_DB = None # Path of an optional SQLite mirror of the plan files, fed by every ledger append (e.g. "focus.db")
+TRIAGE_CHECKPOINT_INTERVAL = 10 # Write the full stack again after this many Triage Delta markers (0: always)
 MEETING_COLOR = "\033[1;32m" # Green
 OVERLAP_COLOR = "\033[1;31m" # Red
+TRIAGE_HELP = "Cmds: [p# #] reorder, [a# #] assign, [e#] edit, [f] free write, [i#] ignore, [N#] prioritize, [n#] add, [>>] defer all, [b#] break, [w] focus, [o#] notes, [j#] jump, [u/d] page, [/text] search, [q] quit"
+SEARCH_RESULT_LIMIT = 10 # Hits shown under the triage or focus view for a /query
+
+# Task marker at the start of a line: [], [ ], [x], [-], [>] or [e]
+MARKER_RE = re.compile(r'^\[([xe\->\s]?)\]\s*')
+# A full Triage marker, as opposed to Triage Delta, Triage Removed or Triage Session Started at
+TRIAGE_FULL_RE = re.compile(rb'------- Triage \d')
+# Lists the whole stack and replaces everything parsed before it
+CHECKPOINT_MARKER = b"------- Triage Checkpoint "
+LEDGER_SCAN_BLOCK = 1 << 16 # Bytes read per step when searching backwards for a checkpoint
+# Bump when the parser state layout or semantics change to discard old sidecar caches
+PARSE_CACHE_VERSION = 4
+# Per-directory record of which plan files still hold pending tasks, so rescue can skip the rest
+MANIFEST_NAME = ".focus-manifest.json"
+MANIFEST_VERSION = 1
+# A pending top-level task in raw ledger bytes
+PENDING_LINE_RE = re.compile(rb'^\[\s?\]', re.MULTILINE)
 
 BREAK_QUOTES = [
     "The time to relax is when you don't have time for it. – Sydney J. Harris",
@@ -86,12 +151,32 @@ def parse_defer_date(date_str):
 def get_target_file(date):
     return date.strftime(f'{DATE_FORMAT}-plan.txt')
 
+# Meeting time formats, matched against upper-cased text
+MEETING_DURATION_RE = re.compile(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)\s*(?:(\d+)H)?\s*(?:(\d+)M)?') # 2 PM 2h 15m
+MEETING_AMPM_RANGE_RE = re.compile(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)\s*-\s*(\d{1,2}(?::\d{2})?)\s*(AM|PM)') # 11:00 AM-1:00 PM
+MEETING_RANGE_RE = re.compile(r'(\d{1,2}(?::\d{2})?)\s*-\s*(\d{1,2}(?::\d{2})?)\s*(AM|PM)') # 2:00-3:00 PM or 2-3 PM
+MEETING_STRIP_PATTERNS = [
+    # Format: 11:00 AM-1:00 PM (must be before more general formats)
+    re.compile(r'\d{1,2}(?::\d{2})?\s*(?:AM|PM)\s*-\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)', re.IGNORECASE),
+    # Format: 2:00-3:00 PM or 2-3 PM
+    re.compile(r'\d{1,2}(?::\d{2})?\s*-\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)', re.IGNORECASE),
+    # Format: 2 PM 2h 15m or just 2 PM
+    re.compile(r'\d{1,2}(?::\d{2})?\s*(?:AM|PM)(?:\s*\d+H)?(?:\s*\d+M)?', re.IGNORECASE)
+]
+MEETING_CACHE_SIZE = 1024
+
 def parse_meeting_time(text):
-    now = datetime.now()
+    """Returns the (start, end) datetimes of a meeting line for today, or None."""
+    # Keyed on today's midnight as well, so yesterday's results are never returned
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return _parse_meeting_time(text, today)
+
+@functools.lru_cache(maxsize=MEETING_CACHE_SIZE)
+def _parse_meeting_time(text, now):
     text = text.upper()
 
     # 1. Check for 2 PM 2h 15m format
-    m1 = re.search(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)\s*(?:(\d+)H)?\s*(?:(\d+)M)?', text)
+    m1 = MEETING_DURATION_RE.search(text)
     if m1 and (m1.group(3) or m1.group(4)):
         start_time_str = m1.group(1)
         ampm = m1.group(2)
@@ -103,14 +188,14 @@ def parse_meeting_time(text):
         return start_dt, end_dt
 
     # 2. Check for 11:00 AM-1:00 PM format
-    m2 = re.search(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)\s*-\s*(\d{1,2}(?::\d{2})?)\s*(AM|PM)', text)
+    m2 = MEETING_AMPM_RANGE_RE.search(text)
     if m2:
         start_dt = _parse_time_with_ampm(m2.group(1), m2.group(2), now)
         end_dt = _parse_time_with_ampm(m2.group(3), m2.group(4), now)
         return start_dt, end_dt
 
     # 3. Check for 2:00-3:00 PM or 2-3 PM format
-    m3 = re.search(r'(\d{1,2}(?::\d{2})?)\s*-\s*(\d{1,2}(?::\d{2})?)\s*(AM|PM)', text)
+    m3 = MEETING_RANGE_RE.search(text)
     if m3:
         end_time_str = m3.group(2)
         ampm = m3.group(3)
@@ -127,6 +212,55 @@ def parse_meeting_time(text):
 
     return None
 
+def get_meeting_intervals(items):
+    """Returns (start, end, index) for every meeting in items, sorted by start time.
+
+    Meetings with the same start keep their stack order. A meeting that ends
+    before it starts crosses midnight, so it is taken to end the next day.
+    """
+    intervals = []
+    for i, item in enumerate(items):
+        m_time = parse_meeting_time(item['line'])
+        if m_time:
+            start, end = m_time
+            if end < start:
+                end += timedelta(days=1)
+            intervals.append((start, end, i))
+    intervals.sort(key=lambda interval: interval[0])
+    return intervals
+
+def find_overlapping_meetings(intervals):
+    """Returns the indices of meetings that overlap another one.
+
+    A sweep over start and end events in time order, O(m log m). Intervals are
+    half-open, so back-to-back meetings do not overlap, and empty intervals
+    never overlap anything.
+    """
+    events = []
+    for start, end, idx in intervals:
+        if start < end:
+            events.append((start, 1, idx))
+            events.append((end, 0, idx))
+    # Ends sort before starts at the same instant
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    active = set()
+    unmarked = set() # active meetings not yet known to overlap
+    overlapping = set()
+    for _, is_start, idx in events:
+        if not is_start:
+            active.discard(idx)
+            unmarked.discard(idx)
+            continue
+        if active:
+            overlapping.add(idx)
+            overlapping.update(unmarked)
+            unmarked.clear()
+        else:
+            unmarked.add(idx)
+        active.add(idx)
+    return overlapping
+
 def _parse_time_with_ampm(time_str, ampm, reference_date):
     if ':' in time_str:
         h, m = map(int, time_str.split(':'))
@@ -141,29 +275,249 @@ def _parse_time_with_ampm(time_str, ampm, reference_date):
 
     return reference_date.replace(hour=h, minute=m, second=0, microsecond=0)
 
+@functools.lru_cache(maxsize=MEETING_CACHE_SIZE)
 def strip_meeting_time(text):
     """Removes supported meeting time patterns from task text."""
-    patterns = [
-        # Format: 11:00 AM-1:00 PM (must be before more general formats)
-        r'\d{1,2}(?::\d{2})?\s*(?:AM|PM)\s*-\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)',
-        # Format: 2:00-3:00 PM or 2-3 PM
-        r'\d{1,2}(?::\d{2})?\s*-\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)',
-        # Format: 2 PM 2h 15m or just 2 PM
-        r'\d{1,2}(?::\d{2})?\s*(?:AM|PM)(?:\s*\d+H)?(?:\s*\d+M)?'
-    ]
     result = text
-    for p in patterns:
-        result = re.sub(p, '', result, flags=re.IGNORECASE)
+    for p in MEETING_STRIP_PATTERNS:
+        result = p.sub('', result)
 
     # Cleanup extra spaces
     result = re.sub(r'\s+', ' ', result).strip()
     return result
 
+def normalize_task_text(text):
+    """Folds a task line for duplicate detection: marker, meeting time, case and spacing removed."""
+    text = MARKER_RE.sub('', text.strip())
+    return " ".join(strip_meeting_time(text).casefold().split())
+
+def task_token_key(normalized):
+    """Word order and punctuation insensitive key under which near-duplicate tasks collide."""
+    return " ".join(sorted(set(searchindex.tokenize(normalized))))
+
+ANSI_ESCAPE_RE = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
+
+class ScreenBuffer:
+    """A frame of terminal output that is flushed as a diff against the previous frame.
+
+    Renderers print() into the buffer (it is file-like); present() then moves
+    the cursor to each changed row and rewrites only those, in one write().
+    """
+    def __init__(self):
+        self.parts = []
+        self.lines = None # Lines of the frame on screen, None when unknown
+        self.starts = []  # Physical row where each line starts
+        self.size = None
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def flush(self):
+        pass
+
+    def invalidate(self):
+        """Forget what is on screen, so the next frame is drawn in full."""
+        self.lines = None
+
+    def _layout(self, lines, width):
+        starts = []
+        row = 0
+        for line in lines:
+            starts.append(row)
+            row += max(1, math.ceil(len(ANSI_ESCAPE_RE.sub('', line)) / width))
+        return starts, row
+
+    def present(self, out, cursor_col):
+        """Writes the buffered frame, leaving the cursor cursor_col characters into its last line."""
+        text = "".join(self.parts)
+        self.parts = []
+        lines = text.split("\n")
+        size = shutil.get_terminal_size((80, 24))
+        width, height = size.columns, size.lines
+        starts, total_rows = self._layout(lines, width)
+        cursor_row = starts[-1] + cursor_col // width
+        last_visible = len(ANSI_ESCAPE_RE.sub('', lines[-1]))
+
+        chunks = []
+        if self.lines is None or size != self.size or total_rows > height:
+            chunks.append("\033[H\033[2J")
+            chunks.append(text)
+            if cursor_col < last_visible:
+                chunks.append(f"\033[{last_visible - cursor_col}D")
+        else:
+            for i, line in enumerate(lines):
+                if i < len(self.lines) and self.lines[i] == line and self.starts[i] == starts[i]:
+                    continue
+                end = starts[i + 1] if i + 1 < len(lines) else total_rows
+                for row in range(starts[i], end):
+                    chunks.append(f"\033[{row + 1};1H\033[2K")
+                chunks.append(f"\033[{starts[i] + 1};1H{line}")
+            old_rows = self._layout(self.lines, width)[1]
+            if total_rows < old_rows:
+                chunks.append(f"\033[{total_rows + 1};1H\033[J")
+            chunks.append(f"\033[{cursor_row + 1};{cursor_col % width + 1}H")
+
+        out.write("".join(chunks))
+        out.flush()
+
+        # A frame taller than the terminal scrolled, so rows can't be addressed next time
+        self.lines = lines if total_rows <= height else None
+        self.starts = starts
+        self.size = size
+
+    def patch_rows(self, rows, out):
+        """Rewrites single-row lines in place (e.g. timer headers), keeping the cursor where it is."""
+        chunks = []
+        for i, line in sorted(rows.items()):
+            known = self.lines is not None and i < len(self.lines) - 1
+            if known and self.lines[i] == line:
+                continue
+            chunks.append(f"\033[{i + 1};1H\033[2K{line}")
+            if self.lines is not None:
+                fits = (known and self.starts[i] == i and self.starts[i + 1] == i + 1 and
+                        len(ANSI_ESCAPE_RE.sub('', line)) <= self.size.columns)
+                if fits:
+                    self.lines[i] = line
+                else:
+                    self.invalidate()
+        if chunks:
+            out.write("\033[s" + "".join(chunks) + "\033[u")
+            out.flush()
+
+class LedgerWriter:
+    """Appends to ledger files through one open handle per file.
+
+    Markers appended while a batch() is open are grouped into a single write
+    per file when the outermost batch ends. The durability mode decides what
+    happens then: "none" keeps them buffered until flush() (before the file is
+    read, edited or the program exits), "flush" writes them, and "fsync" also
+    syncs them to disk. Readers inside a batch see the unwritten markers
+    through pending_data().
+    """
+    def __init__(self, durability=LEDGER_DURABILITY, on_write=None, on_flush=None):
+        if durability not in ("none", "flush", "fsync"):
+            raise ValueError(f"Unknown ledger durability: {durability}")
+        self.durability = durability
+        self.on_write = on_write # Called as on_write(path, data, write) around each write
+        self.on_flush = on_flush # Called after each flush(), once everything pending is written
+        self.handles = {} # path -> (file, (st_dev, st_ino))
+        self.pending = OrderedDict() # path -> [bytes]
+        self.depth = 0
+
+    def append(self, path, data):
+        self.pending.setdefault(path, []).append(data)
+        if not self.depth and self.durability != "none":
+            self.flush()
+
+    def pending_data(self, path):
+        """Returns the bytes appended to path that are not written yet."""
+        return b"".join(self.pending.get(path, ()))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Groups every append until the outermost batch ends."""
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if not self.depth and self.durability != "none":
+                self.flush()
+
+    def _handle(self, path):
+        """Returns the open handle for path, reopening it if the file was replaced or removed."""
+        entry = self.handles.get(path)
+        try:
+            st = os.stat(path)
+            identity = (st.st_dev, st.st_ino)
+        except OSError:
+            identity = None
+        if entry is not None and entry[1] == identity:
+            return entry[0]
+        if entry is not None:
+            entry[0].close()
+        f = open(path, 'ab', buffering=0)
+        st = os.fstat(f.fileno())
+        self.handles[path] = (f, (st.st_dev, st.st_ino))
+        return f
+
+    def flush(self):
+        """Writes all pending markers, syncing them to disk in "fsync" mode."""
+        while self.pending:
+            path, chunks = next(iter(self.pending.items()))
+            data = b"".join(chunks)
+            f = self._handle(path)
+            def write():
+                view = memoryview(data)
+                while view:
+                    view = view[f.write(view):]
+            if self.on_write:
+                self.on_write(path, data, write)
+            else:
+                write()
+            if self.durability == "fsync":
+                os.fsync(f.fileno())
+            del self.pending[path]
+        if self.on_flush:
+            self.on_flush()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            for f, _ in self.handles.values():
+                f.close()
+            self.handles.clear()
+
+def parse_ledger_file(filepath):
+    """Parses one ledger in a worker process, returning the same stack as FocusCLI._parse_file.
+
+    Returns (stack, manifest entry); the worker saves the file's parse cache
+    but leaves the shared manifest for the parent to record and write once.
+    """
+    cli = FocusCLI()
+    stack = cli._parse_file(filepath)
+    cli._save_parse_caches()
+    return stack, cli._get_manifest(filepath).get(os.path.basename(filepath))
+
+def summarize_ledger_file(filepath):
+    """Counts one ledger's resolved tasks in a worker process, as FocusCLI.get_daily_summary does."""
+    return FocusCLI().get_daily_summary(filepath)
+
+def parse_date_range(text):
+    """Parses "YYYYMMDD..YYYYMMDD" (or one date) into (start, end) datetimes, or None if invalid."""
+    first, _, last = text.partition("..")
+    try:
+        start = datetime.strptime(first, DATE_FORMAT)
+        end = datetime.strptime(last, DATE_FORMAT) if last else start
+    except ValueError:
+        return None
+    return (start, end) if start <= end else None
+
+def print_focus_times(title, totals):
+    """Prints focused time per task path, longest first, under a title."""
+    print(f"\n\033[1;32m{title}\033[0m")
+    for path, seconds in sorted(totals.items(), key=lambda kv: (-kv[1], kv[0])):
+        print(f"  {timetrack.format_duration(seconds):>8}  {path}")
+    print(f"  {'Total':>8}  {timetrack.format_duration(sum(totals.values()))}")
+    print("="*35)
+
+def print_scorecard(title, summary):
+    """Prints the Finished, Cancelled and Deferred counts of a summary under a title."""
+    print(f"\n\033[1;32m{title}\033[0m")
+    for label, marker in [("Finished ", '[x]'), ("Cancelled", '[-]'), ("Deferred ", '[>]')]:
+        print(f"  {label} {marker}: {summary['top'][marker] + summary['sub'][marker]}")
+        print(f"    - Top-level: {summary['top'][marker]}")
+        print(f"    - Subtasks:  {summary['sub'][marker]}")
+    print("="*35)
+
 class FocusCLI:
     def __init__(self):
         self.mode = "TRIAGE"
+        self.stack_version = 0 # Bumped by every mutation of the triage stack or any item in it
+        self._focus_cache = None
         self.triage_stack = []
-        self.initial_stack = []
+        self.initial_stack = (None, (), {}) # Snapshot from _snapshot_stack() of the last committed stack
         self.last_msg = "FocusCLI Ready."
         self.task_start_time = None
         self.focus_start_time = None
@@ -173,6 +527,16 @@ class FocusCLI:
         self.focus_threshold = ALERT_THRESHOLD
         self.last_chime_timestamp = 0
         self.chimed_meetings = set()
+        self._meeting_schedule = {'key': None, 'heap': []} # (stack_version, mode) it was built for
+        self._meeting_layout = {'key': None, 'meetings': set(), 'overlaps': set()}
+        # Pending tasks by normalized text and by token key, for the stack and the lookback files.
+        # The stack index is kept per item and updated from _touch_stack; the lookback one is built once per load_context().
+        self._stack_tasks = self._new_stack_index()
+        self._lookback_tasks = {'built': False, 'exact': {}, 'near': {}}
+        self.triage_scroll = 0 # Index of the first item in the triage viewport
+        self.triage_page = 1 # Items shown by the last triage render
+        self.expanded_notes = {} # id(item) -> item whose notes are shown; holding the item keeps its id unique
+        self.expand_all_notes = False
         self.original_termios = None
         self.mini_timer_active = False
         self.mini_timer_duration = 2
@@ -182,25 +546,202 @@ class FocusCLI:
         self.mini_timer_was_meeting = False
         self.last_recorded_focus = None
         self.break_meeting_interrupted = False
-
-    def get_daily_summary(self):
-        """Returns a dictionary of counts for top-level tasks and subtasks."""
-        counts = {
-            'top': {'[x]': 0, '[-]': 0, '[>]': 0},
-            'sub': {'[x]': 0, '[-]': 0, '[>]': 0}
+        self._parse_states = {} # filepath -> incremental parser state
+        self._summary_states = {} # filepath -> incremental scorecard state
+        self._manifests = {} # manifest path -> {plan file name: {pending, size, mtime}}
+        self._dirty_parse_caches = set() # filepaths whose parser state is newer than its sidecar cache
+        self._dirty_manifests = set() # manifest paths changed since they were last written
+        self.search_index = None # Loaded by the first search, then fed by ledger appends
+        self.search_results = [] # Lines shown under the current view until the next command
+        self.mirror = None # LEDGER_DB connection, opened by the first append
+        self.screen = ScreenBuffer()
+        self.ledger = LedgerWriter(on_write=self._write_ledger_data, on_flush=self.save_sidecars)
+
+    @property
+    def triage_stack(self):
+        return self._triage_stack
+
+    @triage_stack.setter
+    def triage_stack(self, stack):
+        self._triage_stack = stack
+        # A whole new stack is indexed again at the next duplicate check
+        self._stack_tasks = self._new_stack_index()
+        self._touch_stack()
+
+    def _touch_stack(self, *items, added=(), removed=()):
+        """Records a mutation of the triage stack or of items in it.
+
+        Invalidates cached focus lookups and meeting layouts, and tells the main
+        loop to redraw. Reordering needs no arguments. Items about to be changed
+        in place must be passed before they are changed, so initial_stack can
+        keep their original line and notes (copy on write); items put into or
+        taken out of the stack go in added and removed, so the duplicate index
+        can follow them.
+        """
+        self.stack_version += 1
+        originals = self.initial_stack[2] if items else None
+        for item in items:
+            if id(item) not in originals:
+                originals[id(item)] = (item, item['line'], item['notes'][:])
+        index = self._stack_tasks
+        if index['built']:
+            # Reindexed at the next duplicate check; None drops the item
+            for item in removed:
+                index['stale'][id(item)] = None
+            for item in items + tuple(added):
+                index['stale'][id(item)] = item
+
+    def _snapshot_stack(self):
+        """Freezes the stack as (stack_version, items, originals).
+
+        The items tuple shares the live item dicts. originals starts empty and
+        is filled by _touch_stack with the content of items changed in place
+        while this is initial_stack.
+        """
+        return (self.stack_version, tuple(self.triage_stack), {})
+
+    def _stack_changed_since(self, snapshot):
+        """Whether the stack differs from a snapshot; free when nothing was touched since.
+
+        Reordered, added or removed items are found by identity; only items
+        changed in place have their content compared.
+        """
+        version, frozen, originals = snapshot
+        if version == self.stack_version:
+            return False
+        stack = self.triage_stack
+        if len(stack) != len(frozen) or any(t is not f for t, f in zip(stack, frozen)):
+            return True
+        return any(item['line'] != line or item['notes'] != notes for item, line, notes in originals.values())
+
+    def _get_focus(self, top_task):
+        """Cached _get_recursive_focus for the top task, valid until the stack is mutated."""
+        cache = self._focus_cache
+        if cache and cache['item'] is top_task and cache['version'] == self.stack_version:
+            return cache['focus']
+        focus = self._get_recursive_focus(top_task)
+        self._focus_cache = {'item': top_task, 'version': self.stack_version, 'focus': focus}
+        return focus
+
+    def get_daily_summary(self, filepath=None):
+        """Returns a dictionary of counts for top-level tasks and subtasks of filepath (default FILENAME).
+
+        The counts are seeded by one pass over the ledger and then kept up to
+        date by commit_to_ledger; the file is only rescanned when it changed
+        outside this process. Markers an open batch has not written yet are
+        counted on a copy of the state.
+        """
+        filepath = filepath or FILENAME
+        if not os.path.exists(filepath):
+            self._summary_states.pop(filepath, None)
+            state = self._new_summary_state()
+        else:
+            state = self._summary_states.get(filepath)
+            if state is None or not self._is_ledger_state_current(filepath, state):
+                with open(filepath, 'rb') as f:
+                    if state is None or not self._is_ledger_prefix_intact(f, state):
+                        state = self._new_summary_state()
+                    mtime = os.fstat(f.fileno()).st_mtime_ns
+                    with ledgerio.mapped(f) as buf:
+                        self._feed_ledger_state(state, buf, self._summarize_lines, state['offset'])
+                state['mtime'] = mtime
+                self._summary_states[filepath] = state
+
+        # Markers still buffered by an open batch are counted without writing them
+        pending = self.ledger.pending_data(filepath)
+        if not pending:
+            return copy.deepcopy(state['counts'])
+        if not state['complete']:
+            # They continue the last line on disk
+            self.ledger.flush()
+            return self.get_daily_summary(filepath)
+        scratch = dict(state)
+        scratch['counts'] = copy.deepcopy(state['counts'])
+        scratch['latest_states'] = ChainMap({}, state['latest_states'])
+        scratch['stack'] = list(state['stack'])
+        self._feed_ledger_state(scratch, pending, self._summarize_lines)
+        return scratch['counts']
+
+    def get_range_summary(self, start, end):
+        """Returns (counts, files) for the daily plan files dated start to end inclusive.
+
+        Files are summarized in worker processes when there are enough of them
+        and their counts are added up as they arrive. Each file is summarized
+        from a fresh state, so at most one is in memory per worker.
+        """
+        filepaths = [get_target_file(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+        filepaths = [p for p in filepaths if os.path.exists(p)]
+        totals = self._new_summary_state()['counts']
+        for counts in self._map_ledger_files(summarize_ledger_file, summarize_ledger_file, filepaths):
+            for level, group in counts.items():
+                for marker, n in group.items():
+                    totals[level][marker] += n
+        return totals, len(filepaths)
+
+    def get_focus_times(self, start, end):
+        """Returns ({task path: focused seconds}, files) for the daily plan files dated start to end inclusive.
+
+        Per-file totals come from the time cache while a file is unchanged;
+        the others are tracked, in worker processes when there are enough.
+        """
+        self.ledger.flush()
+        filepaths = [get_target_file(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+        stats = {}
+        for p in filepaths:
+            with contextlib.suppress(OSError):
+                stats[p] = os.stat(p)
+        filepaths = [p for p in filepaths if p in stats]
+
+        # Daily files are looked up in the working directory, as rescue does
+        cache = timetrack.TimeCache(os.getcwd())
+        per_file = {p: cache.get(os.path.basename(p), stats[p]) for p in filepaths}
+        stale = [p for p in filepaths if per_file[p] is None]
+        for p, totals in zip(stale, self._map_ledger_files(timetrack.track_file, timetrack.track_file, stale)):
+            per_file[p] = totals
+            cache.put(os.path.basename(p), stats[p], totals)
+        cache.save()
+
+        totals = {}
+        for p in filepaths:
+            for path, seconds in per_file[p].items():
+                totals[path] = totals.get(path, 0) + seconds
+        return totals, len(filepaths)
+
+    def _new_summary_state(self):
+        """Returns an empty scorecard state for get_daily_summary."""
+        return {
+            'base': 0,
+            'offset': 0,
+            'crc': 0,
+            'mtime': None,
+            'complete': True,
+            'counts': {
+                'top': {'[x]': 0, '[-]': 0, '[>]': 0},
+                'sub': {'[x]': 0, '[-]': 0, '[>]': 0}
+            },
+            'latest_states': {}, # full_path_key -> (state, level)
+            'stack': [], # current hierarchy of content strings
+            'skipping': False # inside a Triage Removed block, which resolves nothing
         }
-        if not os.path.exists(FILENAME): return counts
-
-        latest_states = {} # full_path_key -> (state, level)
-
-        with open(FILENAME, 'r') as f:
-            lines = f.readlines()
 
-        stack = [] # current hierarchy of content strings
-
-        for line in lines:
-            line_raw = line.rstrip('\n\r')
-            if not line_raw.strip() or "-------" in line_raw:
+    def _summarize_lines(self, lines, state):
+        """Replays ledger lines into a scorecard state, adjusting the counts as task states change."""
+        counts = state['counts']
+        latest_states = state['latest_states']
+        stack = state['stack']
+
+        def count(entry, delta):
+            if entry and entry[0] in ['x', '-', '>']:
+                group = counts['top'] if entry[1] == 0 else counts['sub']
+                group[f"[{entry[0]}]"] += delta
+
+        skipping = state['skipping']
+        for line_raw in lines:
+            if isinstance(line_raw, bytes):
+                # Marker lines arrive undecoded
+                skipping = b"------- Triage Removed" in line_raw
+                continue
+            if not line_raw.strip() or skipping:
                 continue
 
             m = re.match(r'^(\s*)', line_raw)
@@ -210,40 +751,33 @@ class FocusCLI:
 
             # Adjust stack to current level
             if level < len(stack):
-                stack = stack[:level]
+                del stack[level:]
             while len(stack) < level:
                 stack.append("") # Fill gaps
 
             marker_match = re.match(r'^\[([xe\->\s]?)\]', clean)
             if marker_match:
-                state = marker_match.group(1).strip()
-                if not state: state = 'pending'
+                task_state = marker_match.group(1).strip()
+                if not task_state: task_state = 'pending'
                 content = clean[marker_match.end():].strip()
 
                 # Build a unique key based on parent path
                 parent_path = " > ".join(stack)
                 full_key = f"{parent_path} > {content}" if parent_path else content
 
-                latest_states[full_key] = (state, level)
+                entry = (task_state, level)
+                count(latest_states.get(full_key), -1)
+                count(entry, 1)
+                latest_states[full_key] = entry
                 stack.append(content)
             else:
                 # It's a note; still update stack as it can be a parent
-                content = clean
-                stack.append(content)
-
-        for key, (state, level) in latest_states.items():
-            if state in ['x', '-', '>']:
-                label = f"[{state}]"
-                if level == 0:
-                    if label in counts['top']:
-                        counts['top'][label] += 1
-                else:
-                    if label in counts['sub']:
-                        counts['sub'][label] += 1
-        return counts
+                stack.append(clean)
+        state['skipping'] = skipping
 
     def _run_with_vi(self, args):
         """Spawns vi with terminal state management."""
+        self.ledger.flush()
         fd = sys.stdin.fileno()
         if self.original_termios:
             termios.tcsetattr(fd, termios.TCSADRAIN, self.original_termios)
@@ -252,6 +786,7 @@ class FocusCLI:
 
     def enter_free_write(self):
         """Appends Free Write marker, launches vi, reloads context, and sorts the stack."""
+        self.ledger.flush()
         with open(FILENAME, 'a') as f:
             f.write(f"\n------- Free Write {get_timestamp()} -------\n\n")
 
@@ -261,7 +796,7 @@ class FocusCLI:
         self.commit_to_ledger("Triage Session Started at", [])
         self.load_context()
         self.sort_triage_stack()
-        self.initial_stack = copy.deepcopy(self.triage_stack)
+        self.initial_stack = self._snapshot_stack()
 
     def sort_triage_stack(self):
         """Move non-active meetings to the bottom, sorted by start time, while keeping active meetings at top."""
@@ -269,28 +804,28 @@ class FocusCLI:
             return
 
         now = datetime.now()
-        active_meetings = []
-        other_tasks = []
-        inactive_meetings = []
-
-        for item in self.triage_stack:
-            m_time = parse_meeting_time(item['line'])
-            if m_time:
-                if m_time[0] <= now < m_time[1]:
-                    active_meetings.append(item)
-                else:
-                    inactive_meetings.append((m_time[0], item))
+        active_indices = []
+        inactive_indices = [] # already sorted by start time
+
+        for start, end, idx in get_meeting_intervals(self.triage_stack):
+            if start <= now < end:
+                active_indices.append(idx)
             else:
-                other_tasks.append(item)
+                inactive_indices.append(idx)
 
-        # Sort inactive meetings by start time
-        inactive_meetings.sort(key=lambda x: x[0])
-        sorted_inactive = [m[1] for m in inactive_meetings]
+        meeting_indices = set(active_indices) | set(inactive_indices)
+        stack = self.triage_stack
+        active_meetings = [stack[i] for i in sorted(active_indices)]
+        other_tasks = [t for i, t in enumerate(stack) if i not in meeting_indices]
+        sorted_inactive = [stack[i] for i in inactive_indices]
 
-        self.triage_stack = active_meetings + other_tasks + sorted_inactive
+        self.triage_stack[:] = active_meetings + other_tasks + sorted_inactive
+        self._touch_stack()
 
     def load_context(self):
         """Whole-file aware parser with resolution logic. Resolutions are [x], [-], [>], and [e]."""
+        # Previous days may have changed since the lookback index was built
+        self._lookback_tasks['built'] = False
         if not os.path.exists(FILENAME):
             with open(FILENAME, 'w') as f: f.write(f"Session Start - {get_timestamp()}\n")
             self.triage_stack = []
@@ -299,24 +834,19 @@ class FocusCLI:
         self.triage_stack = self._parse_file(FILENAME)
 
     def rescue_previous_tasks(self):
-        """Scans the last 7 days for pending tasks and defers them to today."""
+        """Scans the last RESCUE_LOOKBACK_DAYS days for pending tasks and defers them to today."""
         # Only rescue if we are using the default daily plan format
         today_str = datetime.now().strftime(DATE_FORMAT)
         if FILENAME != f"{today_str}-plan.txt":
             return
 
         all_rescued_tasks = []
-        today_dt = datetime.now()
-
-        # Scan forward from 7 days ago to yesterday
-        for i in range(7, 0, -1):
-            prev_date = today_dt - timedelta(days=i)
-            prev_file = get_target_file(prev_date)
-
-            if os.path.exists(prev_file):
-                # Parse the file for pending items
-                tasks_and_notes = self._parse_file(prev_file)
+        prev_files = self._lookback_files()
+        parsed = self._parse_files(prev_files)
 
+        # All appends go out together once every file has been handled, one write per file in date order
+        with self.ledger.batch():
+            for prev_file, tasks_and_notes in zip(prev_files, parsed):
                 # We only want tasks (starting with [])
                 pending_tasks = [t for t in tasks_and_notes if t['line'].strip().startswith('[]')]
 
@@ -344,99 +874,431 @@ class FocusCLI:
                         t_task = self._prepare_task_with_markers(rescued_task, '[]', '[]')
                         all_rescued_tasks.append(t_task)
 
-        if all_rescued_tasks:
-            self.commit_to_ledger("Deferred from last session", all_rescued_tasks)
-            # Update in-memory stack
-            self.triage_stack.extend(all_rescued_tasks)
+            if all_rescued_tasks:
+                self.commit_to_ledger("Deferred from last session", all_rescued_tasks)
+                # Update in-memory stack
+                self.triage_stack.extend(all_rescued_tasks)
+                self._touch_stack(added=all_rescued_tasks)
+
+        # Every pending top-level task in the scanned files is now deferred
+        self.ledger.flush()
+        for prev_file in prev_files:
+            self._set_manifest_entry(prev_file, False)
+        self.save_sidecars()
+
+    def _lookback_window(self):
+        """The previous RESCUE_LOOKBACK_DAYS plan files that exist, oldest first."""
+        today_dt = datetime.now()
+        prev_files = [get_target_file(today_dt - timedelta(days=i)) for i in range(RESCUE_LOOKBACK_DAYS, 0, -1)]
+        return [p for p in prev_files if os.path.exists(p)]
+
+    def _lookback_files(self):
+        """The previous RESCUE_LOOKBACK_DAYS plan files that may hold pending tasks, oldest first."""
+        # The manifest rules out files whose tasks were all finished or deferred
+        return [p for p in self._lookback_window() if not self._is_known_finished(p)]
+
+    def _parse_files(self, filepaths):
+        """Parses several ledgers, in a process pool when there are enough of them. Results keep the input order."""
+        stacks = []
+        results = self._map_ledger_files(parse_ledger_file, lambda p: (self._parse_file(p), None), filepaths)
+        for p, (stack, entry) in zip(filepaths, results):
+            if entry is not None:
+                # Parsed by a worker, which leaves the manifest to this process
+                self._set_manifest_entry(p, entry['pending'], entry['size'], entry['mtime'])
+            stacks.append(stack)
+        return stacks
+
+    def _map_ledger_files(self, worker, local, filepaths):
+        """Yields the result for each ledger in input order as it becomes available.
+
+        With at least PARALLEL_MIN_FILES files, worker (a module-level
+        function) runs in a process pool; otherwise, or for whatever is left if
+        the pool fails, local runs in this process.
+        """
+        self.ledger.flush()
+        done = 0
+        if len(filepaths) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=min(len(filepaths), os.cpu_count() or 1)) as pool:
+                    for result in pool.map(worker, filepaths):
+                        yield result
+                        done += 1
+            except (OSError, RuntimeError) as e:
+                # Pools are unavailable in some sandboxes; working serially gives the same result
+                logging.info(f"Parallel run failed, continuing serially: {e}")
+        for p in filepaths[done:]:
+            yield local(p)
+
+    def _new_parse_state(self):
+        """Returns an empty parser state for _parse_file."""
+        return {
+            'base': 0,            # where parsing started: 0 or the last Triage Checkpoint
+            'offset': 0,          # bytes of the file consumed so far
+            'crc': 0,             # zlib.crc32 of the bytes from base to offset
+            'mtime': None,
+            'complete': True,     # False if the last parsed line had no newline
+            'entries': OrderedDict(), # content -> {notes, is_task}, in stack order
+            'note_contents': set(),   # contents of non-task entries
+            'last_entry_content': None,
+            'removing': False,    # inside a Triage Removed block
+            'deltas': 0,          # Triage Delta markers since the last full Triage that listed items
+            'full_triage': False  # after a full Triage marker that has not listed an item yet
+        }
+
+    def _is_ledger_prefix_intact(self, f, state):
+        """Checks that the bytes already consumed into a ledger state are unchanged on disk."""
+        st = os.fstat(f.fileno())
+        if st.st_size < state['offset']:
+            return False
+        if st.st_size == state['offset'] and st.st_mtime_ns == state['mtime']:
+            return True
+        if st.st_size > state['offset'] and not state['complete']:
+            # The last line we parsed has since been extended
+            return False
+
+        crc = 0
+        remaining = state['offset'] - state['base']
+        f.seek(state['base'])
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                return False
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+        return crc == state['crc']
 
     def _parse_file(self, filepath):
         """Parses a ledger file and returns a list of active tasks and notes."""
+        return self._stack_from_parse_state(self._get_parse_state(filepath))
+
+    def _stack_from_parse_state(self, state):
+        stack = []
+        for content, entry in state['entries'].items():
+            stack.append({
+                'line': f"[] {content}" if entry['is_task'] else content,
+                'notes': list(entry['notes'].values())
+            })
+        return stack
+
+    def _get_parse_state(self, filepath):
+        """Returns the parser state of a ledger file, brought up to date.
+
+        The parser state is kept per file, in memory and in a sidecar cache, so a
+        reload of an append-only ledger only replays the bytes added since the
+        previous parse. A full parse is done when the file shrank or the
+        already-parsed prefix changed. Markers an open batch has not written yet
+        are replayed into a copy of the state, which is returned instead.
+        """
         if not os.path.exists(filepath):
-            return []
+            self._parse_states.pop(filepath, None)
+            state = self._new_parse_state()
+        else:
+            state = self._parse_states.get(filepath)
+            if state is None:
+                state = self._load_parse_cache(filepath)
+
+            st = os.stat(filepath)
+            if state is None or st.st_size != state['offset'] or st.st_mtime_ns != state['mtime']:
+                with open(filepath, 'rb') as f:
+                    if state is None or not self._is_ledger_prefix_intact(f, state):
+                        state = self._new_parse_state()
+                        # Nothing before the last checkpoint can affect the stack
+                        state['base'] = state['offset'] = self._find_last_checkpoint(f)
+                    mtime = os.fstat(f.fileno()).st_mtime_ns
+                    with ledgerio.mapped(f) as buf:
+                        self._feed_ledger_state(state, buf, self._parse_lines, state['offset'])
+                state['mtime'] = mtime
+                self._dirty_parse_caches.add(filepath)
+            self._parse_states[filepath] = state
+            self._set_manifest_entry(filepath, self._has_pending_tasks(state), state['offset'], state['mtime'])
+
+        # Markers still buffered by an open batch are replayed without writing them
+        pending = self.ledger.pending_data(filepath)
+        if pending:
+            if not state['complete']:
+                # They continue the last line on disk
+                self.ledger.flush()
+                return self._get_parse_state(filepath)
+            state = self._copy_parse_state(state)
+            self._feed_ledger_state(state, pending, self._parse_lines)
+        return state
+
+    def _copy_parse_state(self, state):
+        """Returns a copy of a parser state that can be replayed into without changing state."""
+        copied = dict(state)
+        copied['entries'] = OrderedDict(
+            (content, {'notes': OrderedDict(entry['notes']), 'is_task': entry['is_task']})
+            for content, entry in state['entries'].items()
+        )
+        copied['note_contents'] = set(state['note_contents'])
+        return copied
+
+    def _has_pending_tasks(self, state):
+        return any(entry['is_task'] for entry in state['entries'].values())
+
+    def _manifest_path(self, filepath):
+        return os.path.join(os.path.dirname(filepath), MANIFEST_NAME)
+
+    def _get_manifest(self, filepath):
+        """Returns the manifest for the directory of filepath, loading it on first use."""
+        path = self._manifest_path(filepath)
+        manifest = self._manifests.get(path)
+        if manifest is None:
+            try:
+                with open(path, 'r') as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = {}
+            manifest = cached.get('files', {}) if cached.get('version') == MANIFEST_VERSION else {}
+            self._manifests[path] = manifest
+        return manifest
+
+    def _set_manifest_entry(self, filepath, pending, size=None, mtime=None):
+        """Records whether a plan file has pending tasks at the given size; pending=None forgets it."""
+        manifest = self._get_manifest(filepath)
+        name = os.path.basename(filepath)
+        if pending is None:
+            if manifest.pop(name, None) is None:
+                return
+        else:
+            if size is None:
+                st = os.stat(filepath)
+                size, mtime = st.st_size, st.st_mtime_ns
+            entry = {'pending': pending, 'size': size, 'mtime': mtime}
+            if manifest.get(name) == entry:
+                return
+            manifest[name] = entry
+
+        self._dirty_manifests.add(self._manifest_path(filepath))
 
-        with open(filepath, 'r') as f:
-            lines = [l.rstrip() for l in f.readlines()]
+    def _save_manifest(self, path):
+        manifest = self._manifests.get(path)
+        if manifest is None:
+            return
+        # Another session may save the same manifest concurrently
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': manifest}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logging.info(f"Could not write manifest {path}: {e}")
+
+    def save_sidecars(self):
+        """Writes the parse caches and manifests changed since they were last saved.
+
+        Ledger appends and parses only mark them dirty; this runs after every
+        ledger flush, so a command's appends cost one write of each.
+        """
+        self._save_parse_caches()
+        for path in self._dirty_manifests:
+            self._save_manifest(path)
+        self._dirty_manifests.clear()
+
+    def _save_parse_caches(self):
+        for filepath in self._dirty_parse_caches:
+            state = self._parse_states.get(filepath)
+            if state is not None:
+                self._save_parse_cache(filepath, state)
+        self._dirty_parse_caches.clear()
+
+    def _is_known_finished(self, filepath):
+        """True if the manifest says filepath, unchanged since, has no pending tasks."""
+        entry = self._get_manifest(filepath).get(os.path.basename(filepath))
+        if not entry or entry['pending']:
+            return False
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False
+        return st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime']
+
+    def _find_last_checkpoint(self, f):
+        """Returns the offset of the last Triage Checkpoint marker, reading back from EOF in blocks, or 0."""
+        needle = b"\n" + CHECKPOINT_MARKER
+        pos = f.seek(0, os.SEEK_END)
+        carry = b"" # Start of the later block, in case the marker spans two blocks
+        while pos > 0:
+            start = max(0, pos - LEDGER_SCAN_BLOCK)
+            f.seek(start)
+            block = f.read(pos - start) + carry
+            idx = block.rfind(needle)
+            if idx != -1:
+                return start + idx + 1
+            carry = block[:len(needle) - 1]
+            pos = start
+        # A checkpoint on the first line is the same as parsing from the start
+        return 0
+
+    def _feed_ledger_state(self, state, buf, replay, start=0):
+        """Replays ledger bytes from buf[start:] into a parser or scorecard state.
+
+        buf may be the bytes of an append or a mapped ledger file; lines are
+        decoded one at a time as the replay consumes them, except markers,
+        which reach the replay as bytes (see ledgerio.iter_text_lines).
+        """
+        size = len(buf) - start
+        if size <= 0:
+            return
+        lines = ledgerio.iter_text_lines(buf, start)
+        try:
+            replay(lines, state)
+        finally:
+            lines.close()
+        with memoryview(buf) as view:
+            state['crc'] = zlib.crc32(view[start:], state['crc'])
+        state['offset'] += size
+        state['complete'] = buf[-1:] == b'\n'
+
+    def _parse_cache_path(self, filepath):
+        directory, name = os.path.split(filepath)
+        return os.path.join(directory, f".{name}.cache")
+
+    def _load_parse_cache(self, filepath):
+        """Loads a parser state from the sidecar cache, or None if there is none."""
+        try:
+            with open(self._parse_cache_path(filepath), 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != PARSE_CACHE_VERSION:
+            return None
 
-        active_entries = {} # content -> {notes, is_task}
-        entry_order = [] # list of contents
-        last_entry_content = None
+        state = self._new_parse_state()
+        for key in ['base', 'offset', 'crc', 'mtime', 'complete', 'last_entry_content', 'removing', 'deltas', 'full_triage']:
+            state[key] = cached[key]
+        for content, is_task, notes in cached['entries']:
+            state['entries'][content] = {
+                'notes': OrderedDict(((kind, key), note) for kind, key, note in notes),
+                'is_task': is_task
+            }
+            if not is_task:
+                state['note_contents'].add(content)
+        return state
+
+    def _save_parse_cache(self, filepath, state):
+        """Writes the parser state to the sidecar cache next to the ledger."""
+        cached = {key: state[key] for key in ['base', 'offset', 'crc', 'mtime', 'complete', 'last_entry_content', 'removing', 'deltas', 'full_triage']}
+        cached['version'] = PARSE_CACHE_VERSION
+        cached['entries'] = [
+            [content, entry['is_task'], [[kind, key, note] for (kind, key), note in entry['notes'].items()]]
+            for content, entry in state['entries'].items()
+        ]
+        cache_path = self._parse_cache_path(filepath)
+        try:
+            with open(cache_path + ".tmp", 'w') as f:
+                json.dump(cached, f)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            logging.info(f"Could not write parse cache {cache_path}: {e}")
+
+    def _parse_lines(self, lines, state):
+        """Replays ledger lines into a parser state.
+
+        Entries and their notes are insertion-ordered dicts, so re-adding,
+        resolving and reordering are O(1) per line.
+        """
+        entries = state['entries']
+        note_contents = state['note_contents']
+        last_entry_content = state['last_entry_content']
+        removing = state['removing']
+        full_triage = state['full_triage']
 
         for line in lines:
-            if "------- Triage" in line:
-                new_entry_order = []
-                for content in entry_order:
-                    if content in active_entries:
-                        if active_entries[content]['is_task']:
-                            new_entry_order.append(content)
-                        else:
-                            del active_entries[content]
-                entry_order = new_entry_order
-                last_entry_content = None
+            if isinstance(line, bytes):
+                # Marker lines arrive undecoded
+                full_triage = False
+                if b"------- Triage Checkpoint" in line:
+                    # The checkpoint lists everything that is still active
+                    entries.clear()
+                    note_contents.clear()
+                    state['deltas'] = 0
+                    last_entry_content = None
+                    removing = False
+                elif b"------- Triage Removed" in line:
+                    removing = True
+                    last_entry_content = None
+                elif b"------- Triage" in line:
+                    if b"------- Triage Delta" in line:
+                        state['deltas'] += 1
+                    elif TRIAGE_FULL_RE.search(line):
+                        # Quitting or focusing without changes writes a bare Triage,
+                        # which must not restart the count towards a checkpoint
+                        full_triage = True
+                    # Notes only survive a Triage if they are listed again
+                    for content in note_contents:
+                        entries.pop(content, None)
+                    note_contents.clear()
+                    last_entry_content = None
+                    removing = False
+                else:
+                    removing = False
+                continue
+
+            if not line.strip():
                 continue
 
-            if not line.strip() or "-------" in line:
+            if full_triage:
+                state['deltas'] = 0
+                full_triage = False
+
+            if removing:
+                # Items dropped from the stack without being resolved
+                if not line.startswith('  '):
+                    clean = line.strip()
+                    marker_match = MARKER_RE.match(clean)
+                    content = clean[marker_match.end():].strip() if marker_match else clean
+                    entries.pop(content, None)
+                    note_contents.discard(content)
                 continue
 
             if not line.startswith('  '):
                 clean = line.strip()
-                marker_match = re.match(r'^\[([xe\->\s]?)\]\s*', clean)
+                marker_match = MARKER_RE.match(clean)
                 if marker_match:
-                    state = marker_match.group(1).strip()
+                    state_char = marker_match.group(1).strip()
                     content = clean[marker_match.end():].strip()
 
-                    if not state:
+                    if not state_char:
                         # Pending task
-                        notes = active_entries.pop(content, {}).get('notes', [])
-                        active_entries[content] = {'notes': notes, 'is_task': True}
-                        if content in entry_order: entry_order.remove(content)
-                        entry_order.append(content)
+                        entry = entries.pop(content, None)
+                        notes = entry['notes'] if entry else OrderedDict()
+                        entries[content] = {'notes': notes, 'is_task': True}
+                        note_contents.discard(content)
                     else:
                         # Resolution
-                        active_entries.pop(content, None)
-                        if content in entry_order: entry_order.remove(content)
+                        entries.pop(content, None)
+                        note_contents.discard(content)
                     last_entry_content = content
                 else:
                     # Non-task entry
                     content = clean
-                    notes = active_entries.pop(content, {}).get('notes', [])
-                    active_entries[content] = {'notes': notes, 'is_task': False}
-                    if content in entry_order: entry_order.remove(content)
-                    entry_order.append(content)
+                    entry = entries.pop(content, None)
+                    notes = entry['notes'] if entry else OrderedDict()
+                    entries[content] = {'notes': notes, 'is_task': False}
+                    note_contents.add(content)
                     last_entry_content = content
             else:
                 # Indented line
-                if last_entry_content and last_entry_content in active_entries:
+                entry = entries.get(last_entry_content) if last_entry_content else None
+                if entry:
                     # Remove only the first 2 spaces to preserve deeper nesting
-                    note = line[2:] if line.startswith('  ') else line.lstrip()
-                    notes_list = active_entries[last_entry_content]['notes']
+                    note = line[2:]
+                    notes = entry['notes']
 
-                    # Subtask/Note resolution logic
-                    sub_marker_match = re.match(r'^\[([xe\->\s]?)\]\s*', note)
+                    # Subtasks are keyed by content so a new state replaces the old one,
+                    # other notes are keyed by their full text
+                    sub_marker_match = MARKER_RE.match(note)
                     if sub_marker_match:
-                        sub_content = note[sub_marker_match.end():].strip()
-                        # Remove any existing instance of this subtask content
-                        new_notes = []
-                        for n in notes_list:
-                            m = re.match(r'^\[[xe\->\s]?\]\s*', n)
-                            if m and n[m.end():].strip() == sub_content:
-                                continue
-                            new_notes.append(n)
-                        notes_list = new_notes
-                        notes_list.append(note)
+                        key = ('task', note[sub_marker_match.end():].strip())
                     else:
-                        if note in notes_list: notes_list.remove(note)
-                        notes_list.append(note)
-                    active_entries[last_entry_content]['notes'] = notes_list
+                        key = ('note', note)
+                    notes.pop(key, None)
+                    notes[key] = note
 
-        stack = []
-        for content in entry_order:
-            if content in active_entries:
-                entry = active_entries[content]
-                stack.append({
-                    'line': f"[] {content}" if entry['is_task'] else content,
-                    'notes': entry['notes']
-                })
-        return stack
+        state['last_entry_content'] = last_entry_content
+        state['removing'] = removing
+        state['full_triage'] = full_triage
 
     def _prepare_defer_tasks(self, task, target_date):
         """Prepare tasks for ledger and target file without committing them."""
@@ -473,11 +1335,14 @@ class FocusCLI:
         ledger_items = []
         target_items = []
         target_res = None
+        removed = []
+        added = []
 
         if base_cmd == '>>':
             count = len(self.triage_stack)
             while self.triage_stack:
                 task = self.triage_stack.pop(0)
+                removed.append(task)
                 l_task, t_task, res = self._prepare_defer_tasks(task, target_date)
                 ledger_items.append(l_task)
                 if t_task: target_items.append(t_task)
@@ -486,6 +1351,7 @@ class FocusCLI:
             if target_res == "today":
                 self.commit_to_ledger("Deferred", ledger_items)
                 self.triage_stack.extend(target_items)
+                added.extend(target_items)
                 self.last_msg = f"Deferred {count} items to end of today's stack"
             else:
                 label = f"Deferred to {target_res}"
@@ -494,10 +1360,12 @@ class FocusCLI:
                 self.last_msg = f"Deferred {count} items to {target_res}"
         else: # base_cmd == '>'
             task = self.triage_stack.pop(0)
+            removed.append(task)
             l_task, t_task, res = self._prepare_defer_tasks(task, target_date)
             if res == "today":
                 self.commit_to_ledger("Deferred", [l_task])
                 self.triage_stack.append(t_task)
+                added.append(t_task)
                 self.last_msg = "Deferred to end of today's stack"
             else:
                 label = f"Deferred to {res}"
@@ -505,9 +1373,10 @@ class FocusCLI:
                 self.commit_to_ledger(label, [l_task])
                 self.last_msg = f"Deferred to {res}"
 
-        self.commit_to_ledger("Triage", self.triage_stack)
+        self._touch_stack(added=added, removed=removed)
+        self._commit_triage(self.triage_stack)
         self.task_start_time = None
-        self.initial_stack = copy.deepcopy(self.triage_stack)
+        self.initial_stack = self._snapshot_stack()
         return True
 
     def _get_multi_line_input(self, context_lines=None):
@@ -667,6 +1536,7 @@ class FocusCLI:
 
     def _update_recursive_item(self, top_item, path, new_sub_item):
         """Update a sub-item in the hierarchy recursively."""
+        self._touch_stack(top_item)
         self._recursive_set(top_item, path, new_sub_item)
 
     def _recursive_set(self, item, path, new_sub_item):
@@ -682,6 +1552,10 @@ class FocusCLI:
 
     def _recursive_insert(self, item, path, new_items, position='before'):
         """Recursively insert items into the hierarchy relative to the focus path."""
+        if not path and position not in ['append', 'prepend_notes']:
+            return True # Signal to parent to insert relative to this item
+
+        self._touch_stack()
         if not path:
             if position == 'append':
                 # Appending to the end of this item's notes
@@ -701,8 +1575,6 @@ class FocusCLI:
                         new_lines.append(f"{prefix}  {n}")
                 item['notes'][0:0] = new_lines
                 return False
-            else:
-                return True # Signal to parent to insert relative to this item
 
         idx = path[0]
         sub_item, end_idx = self._get_subtask_as_item(item, idx)
@@ -729,8 +1601,110 @@ class FocusCLI:
 
         return False
 
+    def _index_pending_lines(self, index, lines, where):
+        """Adds the pending task lines among lines to a duplicate index, keeping the first of each key."""
+        for line in lines:
+            if line.strip().startswith('[]'):
+                normalized = normalize_task_text(line)
+                index['exact'].setdefault(normalized, (line.strip(), where))
+                index['near'].setdefault(task_token_key(normalized), (line.strip(), where))
+
+    def _new_stack_index(self):
+        return {
+            'built': False,
+            'exact': {}, # normalized text -> {id(item): (line, "today")}
+            'near': {}, # token key -> {id(item): (line, "today")}
+            'keys': {}, # id(item) -> [(normalized text, token key)] it is indexed under
+            'stale': {} # id(item) -> item to reindex, or None to drop, since the last duplicate check
+        }
+
+    def _index_stack_item(self, index, item):
+        """Adds the pending task lines of one stack item to the stack index."""
+        keys = []
+        for line in [item['line']] + item['notes']:
+            if line.strip().startswith('[]'):
+                normalized = normalize_task_text(line)
+                token_key = task_token_key(normalized)
+                keys.append((normalized, token_key))
+                index['exact'].setdefault(normalized, {}).setdefault(id(item), (line.strip(), "today"))
+                index['near'].setdefault(token_key, {}).setdefault(id(item), (line.strip(), "today"))
+        index['keys'][id(item)] = keys
+
+    def _unindex_stack_item(self, index, item_id):
+        for normalized, token_key in index['keys'].pop(item_id, ()):
+            for entries, key in [(index['exact'], normalized), (index['near'], token_key)]:
+                found = entries.get(key)
+                if found is not None:
+                    found.pop(item_id, None)
+                    if not found:
+                        del entries[key]
+
+    def _get_duplicate_indexes(self):
+        """Returns the duplicate indexes of the stack and the lookback files.
+
+        The stack index is built once per stack and then only reindexes the
+        items passed to _touch_stack since the last check. The lookback index
+        is built once per load_context() from the lookback files the manifest
+        does not know to be finished. rescue_previous_tasks marks every file it
+        scanned as finished, so after a rescue this leaves only files edited
+        since, or the whole window when a named plan file skipped the rescue.
+        """
+        stack_index = self._stack_tasks
+        if not stack_index['built']:
+            stack_index['built'] = True
+            for t in self.triage_stack:
+                self._index_stack_item(stack_index, t)
+        for item_id, item in stack_index['stale'].items():
+            self._unindex_stack_item(stack_index, item_id)
+            if item is not None:
+                self._index_stack_item(stack_index, item)
+        stack_index['stale'].clear()
+
+        lookback_index = self._lookback_tasks
+        if not lookback_index['built']:
+            lookback_index.update(built=True, exact={}, near={})
+            files = [p for p in self._lookback_files() if p != FILENAME]
+            for p in reversed(files): # Most recent day first, so its copy of a task is the one reported
+                for t in self._parse_file(p):
+                    self._index_pending_lines(lookback_index, [t['line']] + t['notes'], p)
+        return stack_index, lookback_index
+
+    def _find_duplicates(self, items):
+        """Returns (new line, (existing line, where), exact) for each new top-level task already pending.
+
+        Tasks match when their normalized text is equal (exact) or when they
+        have the same set of words (near-duplicate). New tasks in the same batch
+        are checked against each other too.
+        """
+        tasks = [it for it in items if it['indent'] == 0 and it['line'].strip().startswith('[]')]
+        if not tasks:
+            return []
+        stack_index, lookback_index = self._get_duplicate_indexes()
+        batch = {'exact': {}, 'near': {}}
+        found = []
+        for it in tasks:
+            normalized = normalize_task_text(it['line'])
+            token_key = task_token_key(normalized)
+            for index in (stack_index, lookback_index, batch):
+                match = None
+                for kind, key in [('exact', normalized), ('near', token_key)]:
+                    match = index[kind].get(key)
+                    if match is not None:
+                        if index is stack_index:
+                            # Stack entries are kept per item; report the first indexed
+                            match = next(iter(match.values()))
+                        found.append((it['line'], match, kind == 'exact'))
+                        break
+                if match is not None:
+                    break
+            batch['exact'].setdefault(normalized, (it['line'].strip(), "this entry"))
+            batch['near'].setdefault(token_key, (it['line'].strip(), "this entry"))
+        return found
+
     def _handle_hierarchical_new_items(self, base_cmd_orig, items, target_index=None):
         """Processes a batch of items and inserts them into the task tree based on absolute indentation."""
+        duplicates = self._find_duplicates(items)
+        top_level_tasks = [] # Items that made it into the stack
         if target_index is not None:
             mode_label = f"New Entry(s) at index {target_index}"
         else:
@@ -750,19 +1724,15 @@ class FocusCLI:
 
             if idx < len(self.triage_stack):
                 target_task = self.triage_stack[idx]
+                self._touch_stack(target_task)
 
                 if self.mode in ["TRIAGE"] or target_index is not None:
                     focus_path = []
                     focus_indents = [0]
                 else:
-                    _, _, focus_path = self._get_recursive_focus(target_task)
-                    # Calculate absolute indentation of focus path elements
-                    focus_indents = [0] # Top-level task is 0
-                    curr = target_task
-                    for p_idx in focus_path:
-                        sub, _ = self._get_subtask_as_item(curr, p_idx)
-                        focus_indents.append(focus_indents[-1] + 2)
-                        curr = sub
+                    _, _, focus_path = self._get_focus(target_task)
+                    # Absolute indentation of focus path elements, top-level task is 0
+                    focus_indents = [depth * 2 for depth in range(len(focus_path) + 1)]
 
                 msg = "Sub-item(s) Added"
                 if self.mode == "TRIAGE" or target_index is not None:
@@ -838,7 +1808,7 @@ class FocusCLI:
                     self.triage_stack.insert(insert_idx, it)
 
                 if insert_idx == 0 and top_level_tasks:
-                    self.last_recorded_focus = self.triage_stack[0]['line'].strip()
+                    self.last_recorded_focus = None # The new top task gets its own Task Started
                     self.task_start_time = None
 
                 msg = "Task(s) Added" if top_level_tasks else "Note(s) Added"
@@ -855,7 +1825,7 @@ class FocusCLI:
                     self.triage_stack.insert(insert_idx, it)
 
                 if insert_idx == 0 and top_level_tasks:
-                    self.last_recorded_focus = self.triage_stack[0]['line'].strip()
+                    self.last_recorded_focus = None # The new top task gets its own Task Started
                     self.task_start_time = None
 
                 msg = "Task(s) Added & Prioritized" if top_level_tasks else "Note(s) Added & Prioritized"
@@ -871,6 +1841,13 @@ class FocusCLI:
                 else:
                     self.last_msg = msg
 
+        if any_changed:
+            self._touch_stack(added=top_level_tasks)
+        if duplicates:
+            _, (line, where), exact = duplicates[0]
+            kind = "Duplicate of" if exact else "Similar to"
+            more = f" (+{len(duplicates) - 1} more)" if len(duplicates) > 1 else ""
+            self.last_msg = f"{self.last_msg} | {kind} '{line}' ({where}){more}"
         return any_changed
 
     def _insert_hierarchical_batch(self, target, path, items, base_cmd_orig):
@@ -999,13 +1976,154 @@ class FocusCLI:
 
     def commit_to_ledger(self, mode_label, items, target_file=None):
         dest = target_file if target_file else FILENAME
-        with open(dest, 'a') as f:
-            f.write(f"\n------- {mode_label} {get_timestamp()} -------\n")
-            if items:
-                for t in items:
-                    f.write(f"{t['line']}\n")
-                    for n in t['notes']:
-                        f.write(f"  {n}\n")
+        lines = [f"\n------- {mode_label} {get_timestamp()} -------\n"]
+        if items:
+            for t in items:
+                lines.append(f"{t['line']}\n")
+                for n in t['notes']:
+                    lines.append(f"  {n}\n")
+        self.ledger.append(dest, "".join(lines).encode('utf-8'))
+
+    def _commit_triage(self, stack):
+        """Records the triage stack, writing only what the ledger does not already have.
+
+        Tasks still pending in the ledger are moved into place by listing their
+        bare line under a Triage Delta marker, which keeps their notes; only new
+        or changed items are written in full. Tasks that left the stack without
+        being resolved are listed under Triage Removed. A full Triage marker is
+        written instead when it would not be larger, and after every
+        TRIAGE_CHECKPOINT_INTERVAL deltas. That one is a Triage Checkpoint, which
+        replaces the parsed state, so a fresh parse can start from the last one.
+        Nothing is written when the ledger already has the stack as is; returns
+        whether anything was.
+        """
+        state = self._get_parse_state(FILENAME)
+        parsed = self._stack_from_parse_state(state)
+        if len(parsed) == len(stack) and all(p['line'] == t['line'] and p['notes'] == t['notes'] for p, t in zip(parsed, stack)):
+            return False
+        # Only pending tasks survive a Triage marker; notes must be listed again
+        pending = [p for p in parsed if p['line'].startswith('[] ')]
+        positions = {p['line']: i for i, p in enumerate(pending)}
+        stack_lines = {t['line'] for t in stack}
+
+        removed = [{'line': p['line'], 'notes': []} for p in pending if p['line'] not in stack_lines]
+
+        # Leading items already in ledger order with the same notes need not be listed
+        kept = 0
+        last = -1
+        for t in stack:
+            i = positions.get(t['line'])
+            if i is None or i < last or pending[i]['notes'] != t['notes']:
+                break
+            last = i
+            kept += 1
+
+        listed = []
+        for t in stack[kept:]:
+            i = positions.get(t['line'])
+            if i is not None and pending[i]['notes'] == t['notes']:
+                listed.append({'line': t['line'], 'notes': []})
+            else:
+                listed.append(t)
+
+        full_size = sum(1 + len(t['notes']) for t in stack)
+        delta_size = sum(1 + len(t['notes']) for t in listed)
+        checkpoint_due = state['deltas'] + 1 > TRIAGE_CHECKPOINT_INTERVAL
+        if checkpoint_due or len(stack_lines) != len(stack) or delta_size >= full_size:
+            self.commit_to_ledger("Triage Checkpoint", stack)
+        else:
+            if removed:
+                self.commit_to_ledger("Triage Removed", removed)
+            self.commit_to_ledger("Triage Delta", listed)
+        return True
+
+    def _write_ledger_data(self, dest, data, write):
+        """Performs a ledger append via write(), keeping parser and scorecard states warm."""
+        # Only states that match the file before this append can be fed incrementally
+        warm = []
+        for states, replay in [(self._parse_states, self._parse_lines), (self._summary_states, self._summarize_lines)]:
+            state = states.get(dest)
+            if state is None:
+                continue
+            if self._is_ledger_state_current(dest, state):
+                warm.append((states, state, replay))
+            else:
+                states.pop(dest, None)
+        finished = self._is_known_finished(dest)
+        directory = os.path.dirname(os.path.abspath(dest))
+        index = self.search_index
+        if index is not None and index.directory != directory:
+            index = None
+        mirror = self._get_mirror()
+        if mirror is not None and mirror.directory != directory:
+            mirror = None
+        before = None
+        if (index or mirror) and os.path.exists(dest):
+            before = os.stat(dest)
+
+        write()
+
+        st = os.stat(dest)
+        if index is not None:
+            index.append(os.path.basename(dest), data, before, st)
+        if mirror is not None:
+            try:
+                mirror.append(os.path.basename(dest), data, before, st)
+            except sqlite3.Error as e:
+                # The text file is the source of truth; --sync-db catches the mirror up later
+                logging.info(f"Could not update {LEDGER_DB}: {e}")
+        pending = None
+        for states, state, replay in warm:
+            self._feed_ledger_state(state, data, replay)
+            state['mtime'] = st.st_mtime_ns
+            if states is self._parse_states:
+                self._dirty_parse_caches.add(dest)
+                pending = self._has_pending_tasks(state)
+        if pending is None:
+            # Without a parsed state, only appends that add a task or leave a finished file finished are known
+            if PENDING_LINE_RE.search(data):
+                pending = True
+            elif finished:
+                pending = False
+        self._set_manifest_entry(dest, pending, st.st_size, st.st_mtime_ns)
+
+    def _is_ledger_state_current(self, filepath, state):
+        """True if the file is exactly what state was parsed from."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False
+        return state['complete'] and st.st_size == state['offset'] and st.st_mtime_ns == state['mtime']
+
+    def _get_mirror(self):
+        """Returns the LEDGER_DB mirror for the directory of FILENAME, or None when it is not configured."""
+        if not LEDGER_DB:
+            return None
+        if self.mirror is None:
+            try:
+                self.mirror = ledgerdb.LedgerMirror(LEDGER_DB, os.path.dirname(os.path.abspath(FILENAME)))
+            except sqlite3.Error as e:
+                logging.info(f"Could not open {LEDGER_DB}: {e}")
+                return None
+        return self.mirror
+
+    def _get_search_index(self):
+        """Returns the search index for the directory of FILENAME, loading it on first use."""
+        directory = os.path.dirname(os.path.abspath(FILENAME))
+        if self.search_index is None or self.search_index.directory != directory:
+            self.search_index = searchindex.SearchIndex(directory)
+        return self.search_index
+
+    def search(self, query):
+        """Returns the index hits for query across every plan file, most recent first.
+
+        The index is brought up to date in memory only; its changed segments
+        are written on exit.
+        """
+        self.ledger.flush()
+        index = self._get_search_index()
+        index.refresh([os.path.basename(FILENAME)])
+        return index.query(query)
 
     def update_mini_timer(self):
         if not self.mini_timer_active:
@@ -1098,10 +2216,34 @@ class FocusCLI:
         return m_time[0] <= now_dt < m_time[1]
 
     def check_meetings(self):
+        """Fires meeting starts and preemption, consulting only the head of the meeting schedule."""
         if self.mode not in ["FOCUS", "BREAK"]: return
         if not self.triage_stack: return
 
         now = datetime.now()
+        schedule = self._meeting_schedule
+        if schedule['key'] == (self.stack_version, self.mode):
+            if not schedule['heap'] or now < schedule['heap'][0]:
+                return
+
+        self._evaluate_meetings(now)
+        self._rebuild_meeting_schedule(now)
+
+    def _rebuild_meeting_schedule(self, now):
+        """Collects the upcoming meeting starts and ends into a min-heap of deadlines.
+
+        The meeting state of the stack only changes when one of these passes,
+        when the stack is mutated or when the mode changes.
+        """
+        deadlines = []
+        for start, end, _ in get_meeting_intervals(self.triage_stack):
+            deadlines.extend(t for t in (start, end) if t > now)
+        # Meeting times are relative to today, so they all move at midnight
+        deadlines.append(now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1))
+        heapq.heapify(deadlines)
+        self._meeting_schedule = {'key': (self.stack_version, self.mode), 'heap': deadlines}
+
+    def _evaluate_meetings(self, now):
         found_active_meeting = False
         for i, task in enumerate(self.triage_stack):
             m_time = parse_meeting_time(task['line'])
@@ -1123,6 +2265,7 @@ class FocusCLI:
 
                         if not is_current_active_meeting:
                             self.triage_stack.insert(0, self.triage_stack.pop(i))
+                            self._touch_stack()
                             self.task_start_time = None
                             task_content = re.sub(r'^\[[xe\->\s]?\]\s*', '', self.triage_stack[0]['line'])
                             self.last_msg = f"Meeting Started: {task_content}"
@@ -1162,8 +2305,8 @@ class FocusCLI:
 
     def update_timer_ui(self):
         """Minimal redraw of just the header to preserve terminal selection."""
-        sys.stdout.write("\033[s") # Save cursor
         now = time.time()
+        rows = {}
         if self.mode == "TRIAGE":
             focus_elapsed = int(now - (self.focus_start_time if self.focus_start_time else now))
             focus_remaining = self.focus_threshold - focus_elapsed
@@ -1172,7 +2315,7 @@ class FocusCLI:
             f_color = "\033[1;31m" if focus_remaining <= 0 else ""
             timer_str = f" | Focus: {f_color}{f_sign}{fm:02d}:{fs:02d}\033[0m"
 
-            sys.stdout.write("\033[1;1H" + f"\033[K--- TRIAGE: {os.path.basename(FILENAME)}{timer_str} ---")
+            rows[0] = f"--- TRIAGE: {os.path.basename(FILENAME)}{timer_str} ---"
         elif self.mode == "FOCUS":
             if not self.triage_stack: return
             if self.task_start_time is None: self.task_start_time = now
@@ -1215,9 +2358,9 @@ class FocusCLI:
                 color = "\033[1;31;7m"
                 header = " !! BREAK TIME !! "
 
-            sys.stdout.write("\033[1;1H" + f"{color}{'='*65}\033[0m")
-            sys.stdout.write("\033[2;1H" + f"{color}{header}\033[0m{task_timer_str} | Focus: {f_sign}{fm:02d}:{fs:02d}{meeting_timer_str}{mini_timer_str}")
-            sys.stdout.write("\033[3;1H" + f"{color}{'='*65}\033[0m")
+            rows[0] = f"{color}{'='*65}\033[0m"
+            rows[1] = f"{color}{header}\033[0m{task_timer_str} | Focus: {f_sign}{fm:02d}:{fs:02d}{meeting_timer_str}{mini_timer_str}"
+            rows[2] = f"{color}{'='*65}\033[0m"
         elif self.mode == "BREAK":
             elapsed_break = time.time() - self.break_start_time
             remaining = int(self.break_duration * 60 - elapsed_break)
@@ -1229,12 +2372,51 @@ class FocusCLI:
                 color = "\033[1;31;7m"
                 header = " !! BREAK EXPIRED !! " if remaining <= 0 else " !! MEETING STARTING !! "
 
-            sys.stdout.write("\033[1;1H" + f"{color}{'='*65}\033[0m")
-            sys.stdout.write("\033[2;1H" + f"{color}{header}\033[0m | Remaining: {sign}{m:02d}:{s:02d}")
-            sys.stdout.write("\033[3;1H" + f"{color}{'='*65}\033[0m")
-
-        sys.stdout.write("\033[u") # Restore cursor
-        sys.stdout.flush()
+            rows[0] = f"{color}{'='*65}\033[0m"
+            rows[1] = f"{color}{header}\033[0m | Remaining: {sign}{m:02d}:{s:02d}"
+            rows[2] = f"{color}{'='*65}\033[0m"
+
+        self.screen.patch_rows(rows, sys.stdout)
+
+    def _next_wakeup_timeout(self, now):
+        """Seconds until the main loop has work to do without input, or None to block.
+
+        That is the next second boundary while a ticking timer is on screen,
+        the next focus or break chime, and the next meeting deadline.
+        """
+        deadlines = []
+        has_task = bool(self.triage_stack)
+
+        timer_visible = (
+            (self.mode == "FOCUS" and has_task) or
+            self.mode == "BREAK" or
+            (self.mode == "TRIAGE" and self.focus_start_time)
+        )
+        if timer_visible:
+            deadlines.append(math.floor(now) + 1)
+
+        if self.mode == "BREAK" and self.break_start_time:
+            expiry = self.break_start_time + self.break_duration * 60
+            if now >= expiry or self.break_meeting_interrupted:
+                expiry = self.last_chime_timestamp + 60
+            deadlines.append(expiry)
+        elif self.mode in ["FOCUS", "TRIAGE"] and self.focus_start_time:
+            threshold = self.focus_start_time + self.focus_threshold
+            if now >= threshold:
+                threshold = self.last_chime_timestamp + 60
+            deadlines.append(threshold)
+
+        if self.mode in ["FOCUS", "BREAK"] and has_task:
+            schedule = self._meeting_schedule
+            if schedule['key'] != (self.stack_version, self.mode):
+                deadlines.append(now) # Schedule is stale, check_meetings rebuilds it
+            elif schedule['heap']:
+                deadlines.append(schedule['heap'][0].timestamp())
+
+        if not deadlines:
+            return None
+        # A little slack so we wake just after, not just before, the deadline
+        return max(0, min(deadlines) - now) + 0.001
 
     def _read_keypress(self, fd):
         """Reads a single keypress, escape sequence burst, or multi-byte UTF-8 character."""
@@ -1291,6 +2473,7 @@ class FocusCLI:
 
         def signal_handler(sig, frame):
             self._rescue_stack("Interrupted (SIGTERM)")
+            # SystemExit unwinds through the finally below, which closes the ledger and saves the sidecars
             if self.original_termios:
                 termios.tcsetattr(fd, termios.TCSADRAIN, self.original_termios)
             sys.exit(0)
@@ -1304,6 +2487,8 @@ class FocusCLI:
         # Always open in Free Write mode at start
         self.enter_free_write()
         self.focus_start_time = time.time()
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
         try:
             # Set terminal to cbreak mode for the main input loop
             tty.setcbreak(fd)
@@ -1314,14 +2499,13 @@ class FocusCLI:
             last_cursor_pos = None
             last_mode = None
             last_msg = None
-            last_task = None
+            last_stack_version = None
             last_expired = False
             last_exceeded = False
 
             while True:
                 now = time.time()
                 current_second = int(now)
-                current_task = self.triage_stack[0] if self.triage_stack else None
 
                 is_expired = False
                 if self.mode == "BREAK":
@@ -1338,42 +2522,20 @@ class FocusCLI:
                     cursor_pos != last_cursor_pos or
                     self.mode != last_mode or
                     self.last_msg != last_msg or
-                    current_task != last_task or
+                    self.stack_version != last_stack_version or
                     is_expired != last_expired or
                     is_exceeded != last_exceeded
                 )
 
                 if structural_change:
-                    sys.stdout.write("\033[H\033[2J")
-                    if self.mode == "TRIAGE":
-                        self.render_triage()
-                    elif self.mode == "FOCUS":
-                        self.render_focus()
-                    elif self.mode == "BREAK":
-                        self.render_break()
-                    elif self.mode == "EXIT":
-                        self.render_exit()
-
-                    print(f"\n\033[90mStatus: {self.last_msg}\033[0m")
-                    prompt = ">> "
-                    sys.stdout.write(f"\033[1;37m{prompt}\033[0m{buffer}")
-
-                    # Manual cursor positioning for the prompt line
-                    # Note: This is a simplified positioning that doesn't handle multi-line cursor placement perfectly
-                    # but since we're using full-screen redraw, it's sufficient for the user to see where they are.
-                    # We move cursor back by (len(buffer) - cursor_pos)
-                    if cursor_pos < len(buffer):
-                        move_back = len(buffer) - cursor_pos
-                        sys.stdout.write(f"\033[{move_back}D")
-
-                    sys.stdout.flush()
+                    self.draw_screen(buffer, cursor_pos)
 
                     last_render_second = current_second
                     last_buffer = buffer
                     last_cursor_pos = cursor_pos
                     last_mode = self.mode
                     last_msg = self.last_msg
-                    last_task = copy.deepcopy(current_task)
+                    last_stack_version = self.stack_version
                     last_expired = is_expired
                     last_exceeded = is_exceeded
 
@@ -1390,8 +2552,9 @@ class FocusCLI:
                     if self.mode == "FOCUS":
                         self.update_mini_timer()
 
-                rlist, _, _ = select.select([fd], [], [], 0.1)
-                if rlist:
+                # Sleep until input arrives or the next timer, chime or meeting is due
+                events = selector.select(self._next_wakeup_timeout(time.time()))
+                if events:
                     char = self._read_keypress(fd)
                     if not char: continue
 
@@ -1415,6 +2578,8 @@ class FocusCLI:
                         result = self.handle_command(cmd)
                         tty.setcbreak(fd)
                         cursor_pos = 0
+                        # Commands may print, prompt or run vi, so the screen is unknown
+                        self.screen.invalidate()
 
                         if result == "QUIT":
                             print() # Ensure newline for shell prompt
@@ -1460,8 +2625,35 @@ class FocusCLI:
         except KeyboardInterrupt:
             self._rescue_stack("Interrupted")
         finally:
+            self.ledger.close()
+            if self.search_index is not None:
+                self.search_index.save()
+            if self.mirror is not None:
+                self.mirror.close()
+            selector.close()
             termios.tcsetattr(fd, termios.TCSADRAIN, self.original_termios)
 
+    def draw_screen(self, buffer, cursor_pos):
+        """Renders the current mode, status line and prompt, flushing only what changed."""
+        prompt = ">> "
+        with contextlib.redirect_stdout(self.screen):
+            if self.mode == "TRIAGE":
+                self.render_triage()
+            elif self.mode == "FOCUS":
+                self.render_focus()
+            elif self.mode == "BREAK":
+                self.render_break()
+            elif self.mode == "EXIT":
+                self.render_exit()
+
+            if self.search_results and self.mode in ["TRIAGE", "FOCUS"]:
+                print("\n\033[1;33mSEARCH RESULTS\033[0m")
+                print("\n".join(self.search_results))
+
+            print(f"\n\033[90mStatus: {self.last_msg}\033[0m")
+            sys.stdout.write(f"\033[1;37m{prompt}\033[0m{buffer}")
+        self.screen.present(sys.stdout, len(prompt) + cursor_pos)
+
     def render_triage(self):
         now = time.time()
         focus_elapsed = int(now - (self.focus_start_time if self.focus_start_time else now))
@@ -1474,62 +2666,83 @@ class FocusCLI:
 
         print(f"--- TRIAGE: {os.path.basename(FILENAME)}{timer_str} ---")
 
-        meetings = []
-        for i, t in enumerate(self.triage_stack):
-            m_time = parse_meeting_time(t['line'])
-            if m_time:
-                meetings.append({'idx': i, 'start': m_time[0], 'end': m_time[1]})
-
-        overlapping_indices = set()
-        for i in range(len(meetings)):
-            for j in range(i + 1, len(meetings)):
-                m1 = meetings[i]
-                m2 = meetings[j]
-                if m1['start'] < m2['end'] and m2['start'] < m1['end']:
-                    overlapping_indices.add(m1['idx'])
-                    overlapping_indices.add(m2['idx'])
-
-        visible_count = 0
-        for i, t in enumerate(self.triage_stack):
-            if i in overlapping_indices:
-                color = OVERLAP_COLOR
-            elif parse_meeting_time(t['line']):
-                color = MEETING_COLOR
-            elif '[]' in t['line']:
-                color = "\033[1;36m"
+        if not self.triage_stack:
+            self.triage_page = 1
+            print("\n\033[1;36m[FREE WRITE MODE]\033[0m Everything triaged or finished.")
+            return
+
+        meeting_indices, overlapping_indices = self._get_meeting_layout()
+        size = shutil.get_terminal_size((80, 24))
+        width = size.columns
+        def rows(line):
+            return max(1, math.ceil(len(ANSI_ESCAPE_RE.sub('', line)) / width))
+
+        # Header, blank + help, blank + status, prompt and both scroll markers
+        budget = size.lines - 7 - rows(TRIAGE_HELP)
+        if self.search_results:
+            budget -= 2 + sum(rows(line) for line in self.search_results)
+        budget = max(1, budget)
+        self.triage_scroll = start = max(0, min(self.triage_scroll, len(self.triage_stack) - 1))
+
+        if start > 0:
+            print(f"\033[90m  ^ {start} more above (u: page up)\033[0m")
+        i = start
+        used = 0
+        while i < len(self.triage_stack) and used < budget:
+            item_lines, item_rows = [], 0
+            for line in self._triage_item_lines(i, meeting_indices, overlapping_indices):
+                item_rows += rows(line)
+                if used + item_rows > budget:
+                    break
+                item_lines.append(line)
             else:
-                color = ""
-            print(f"{i}: {color}{t['line']}\033[0m")
+                print("\n".join(item_lines))
+                used += item_rows
+                i += 1
+                continue
+            if i == start:
+                # The first item is always shown, truncated to the viewport
+                print("\n".join(item_lines or [line]))
+                i += 1
+            break
+        self.triage_page = max(1, i - start)
+
+        if i < len(self.triage_stack):
+            print(f"\033[90m  v {len(self.triage_stack) - i} more below (d: page down)\033[0m")
+        print(f"\n{TRIAGE_HELP}")
+
+    def _triage_item_lines(self, i, meeting_indices, overlapping_indices):
+        """Formats one triage item; notes stay collapsed to a count unless expanded with 'o'."""
+        t = self.triage_stack[i]
+        if i in overlapping_indices:
+            color = OVERLAP_COLOR
+        elif i in meeting_indices:
+            color = MEETING_COLOR
+        elif '[]' in t['line']:
+            color = "\033[1;36m"
+        else:
+            color = ""
+        expanded = self.expand_all_notes or id(t) in self.expanded_notes
+        collapsed = f" \033[90m[+{len(t['notes'])}]\033[0m" if t['notes'] and not expanded else ""
+        yield f"{i}: {color}{t['line']}\033[0m{collapsed}"
+        if expanded:
             for j, n in enumerate(t['notes']):
                 n_color = "\033[1;36m" if '[]' in n else ""
-                print(f"   {i}.{j}: {n_color}{n}\033[0m")
-            visible_count += 1
-        
-        if visible_count == 0:
-            print("\n\033[1;36m[FREE WRITE MODE]\033[0m Everything triaged or finished.")
-        else:
-            print("\nCmds: [p# #] reorder, [a# #] assign, [e#] edit, [f] free write, [i#] ignore, [N#] prioritize, [n#] add, [>>] defer all, [b#] break, [w] focus, [q] quit")
+                yield f"   {i}.{j}: {n_color}{n}\033[0m"
+
+    def _get_meeting_layout(self):
+        """Returns (meeting indices, overlapping indices), recomputed only when the stack changes."""
+        key = (self.stack_version, datetime.now().date())
+        layout = self._meeting_layout
+        if layout['key'] != key:
+            meetings = get_meeting_intervals(self.triage_stack)
+            layout['meetings'] = {idx for _, _, idx in meetings}
+            layout['overlaps'] = find_overlapping_meetings(meetings)
+            layout['key'] = key
+        return layout['meetings'], layout['overlaps']
 
     def render_exit(self):
-        summary = self.get_daily_summary()
-        print(f"\n\033[1;32mDAILY SCORECARD ({os.path.basename(FILENAME)})\033[0m")
-
-        # Finished [x]
-        print(f"  Finished  [x]: {summary['top']['[x]'] + summary['sub']['[x]']}")
-        print(f"    - Top-level: {summary['top']['[x]']}")
-        print(f"    - Subtasks:  {summary['sub']['[x]']}")
-
-        # Cancelled [-]
-        print(f"  Cancelled [-]: {summary['top']['[-]'] + summary['sub']['[-]']}")
-        print(f"    - Top-level: {summary['top']['[-]']}")
-        print(f"    - Subtasks:  {summary['sub']['[-]']}")
-
-        # Deferred [>]
-        print(f"  Deferred  [>]: {summary['top']['[>]'] + summary['sub']['[>]']}")
-        print(f"    - Top-level: {summary['top']['[>]']}")
-        print(f"    - Subtasks:  {summary['sub']['[>]']}")
-
-        print("="*35)
+        print_scorecard(f"DAILY SCORECARD ({os.path.basename(FILENAME)})", self.get_daily_summary())
         self.last_msg = "Enter 'q' to quit or 'f' to return to Free Write..."
 
     def render_focus(self):
@@ -1551,7 +2764,7 @@ class FocusCLI:
         if not self.triage_stack:
             return
         top_task = self.triage_stack[0]
-        focus_item, parent_item, focus_path = self._get_recursive_focus(top_task)
+        focus_item, parent_item, focus_path = self._get_focus(top_task)
 
         # Handle "Task Started" ledger entry
         # We only log "Task Started" when the root task changes.
@@ -1630,11 +2843,26 @@ class FocusCLI:
             print(f"  {i}: {n_color}{n}\033[0m")
         print("\n" + color + "-"*65 + "\033[0m")
         extra_cmds = ", [Space] reset" if is_mini_session else ""
-        print(f"Cmds: [x] done, [x#] subtask, [e] edit, [-] cancel, [>] defer, [>>] defer all, [f] free write, [m#] mini{extra_cmds}, [N#] prioritize, [n#] add, [i] ignore, [t] triage, [q] quit")
+        print(f"Cmds: [x] done, [x#] subtask, [e] edit, [-] cancel, [>] defer, [>>] defer all, [f] free write, [m#] mini{extra_cmds}, [N#] prioritize, [n#] add, [i] ignore, [t] triage, [/text] search, [q] quit")
 
     def handle_command(self, cmd):
+        """Runs one command, writing every ledger marker it produces in one go."""
+        with self.ledger.batch():
+            return self._handle_command(cmd)
+
+    def _handle_command(self, cmd):
         self.last_msg = "" # Reset status message
+        self.search_results = []
         try:
+            if cmd.startswith('/') and self.mode in ["TRIAGE", "FOCUS"]:
+                query = cmd[1:].strip()
+                hits = self.search(query)
+                self.search_results = [searchindex.format_hit(hit) for hit in hits[:SEARCH_RESULT_LIMIT]]
+                self.last_msg = f"{len(hits)} {'match' if len(hits) == 1 else 'matches'} for '{query}'"
+                if len(hits) > SEARCH_RESULT_LIMIT:
+                    self.last_msg += f", showing the {SEARCH_RESULT_LIMIT} most recent"
+                return
+
             cmd_clean = re.sub(r'^([a-zA-Z])(\d)', r'\1 \2', cmd)
             try:
                 parts = shlex.split(cmd_clean)
@@ -1720,19 +2948,13 @@ class FocusCLI:
                             # OR if the index is 0 (current focus)
                             if target_idx is None or target_idx == 0:
                                 top_task = self.triage_stack[0]
-                                focus_item, _, focus_path = self._get_recursive_focus(top_task)
+                                focus_item, _, focus_path = self._get_focus(top_task)
 
                                 # Building hierarchical context string (just the focused item)
                                 context = []
                                 if focus_path:
-                                    # Find the indentation of the focus item
-                                    indent = ""
-                                    curr = top_task
-                                    for idx in focus_path:
-                                        sub, _ = self._get_subtask_as_item(curr, idx)
-                                        # Every subtask is 2 spaces deeper than its parent line
-                                        indent += "  "
-                                        curr = sub
+                                    # Every subtask is 2 spaces deeper than its parent line
+                                    indent = "  " * len(focus_path)
                                     context.append(f"{indent}{focus_item['line']}")
                             elif target_idx < len(self.triage_stack):
                                 # Context for targeting a specific task at an index
@@ -1755,7 +2977,7 @@ class FocusCLI:
                         self.mini_timer_last_chime_timestamp = 0
                     self.check_meetings()
 
-                self.initial_stack = copy.deepcopy(self.triage_stack)
+                self.initial_stack = self._snapshot_stack()
                 return
 
             if self.mode == "BREAK":
@@ -1778,6 +3000,7 @@ class FocusCLI:
                 if base_cmd == 'w':
                     now = datetime.now()
                     new_stack = []
+                    completed = []
                     for t in self.triage_stack:
                         m_time = parse_meeting_time(t['line'])
                         if m_time and m_time[1] < now:
@@ -1786,19 +3009,22 @@ class FocusCLI:
                             t['line'] = f"[x] {task_content}"
                             t['notes'] = [f"[x] " + re.sub(r'^\[[xe\->\s]?\]\s*', '', n) for n in t['notes']]
                             self.commit_to_ledger("Meeting Auto-Completed", [t])
+                            completed.append(t)
                             continue
                         new_stack.append(t)
-                    self.triage_stack = new_stack
+                    if completed:
+                        self.triage_stack[:] = new_stack
+                        self._touch_stack(removed=completed)
 
-                    active = self.triage_stack
-                    items_to_write = active if active != self.initial_stack else []
-                    self.commit_to_ledger("Triage", items_to_write)
-                    self.triage_stack = active
+                    if not (self._stack_changed_since(self.initial_stack) and self._commit_triage(self.triage_stack)):
+                        self.commit_to_ledger("Triage", [])
                     self.mode = "FOCUS"; self.last_msg = ""
+                    # Record Task Started again so focused time restarts from here
+                    self.last_recorded_focus = None
                     if self.mini_timer_active:
                         self.mini_timer_last_tick = time.time()
                     self.last_chime_timestamp = 0
-                    self.initial_stack = copy.deepcopy(self.triage_stack)
+                    self.initial_stack = self._snapshot_stack()
                 elif base_cmd == 'i':
                     if len(parts) > 1:
                         idx = int(parts[1])
@@ -1809,6 +3035,7 @@ class FocusCLI:
                         idx = int(parts[1])
 
                     item = self.triage_stack.pop(idx)
+                    self._touch_stack(removed=(item,))
                     if item['line'].strip().startswith('[]'):
                         # It's a task, mark as cancelled
                         resolved_item = self._prepare_task_with_markers(item, '[-]', '[-]')
@@ -1816,15 +3043,27 @@ class FocusCLI:
                 elif base_cmd == 'p':
                     src, dest = int(parts[1]), int(parts[2]) if len(parts) > 2 else 0
                     self.triage_stack.insert(dest, self.triage_stack.pop(src))
+                    self._touch_stack()
                 elif base_cmd == 'a':
                     src_str, dest_idx = parts[1], int(parts[2])
-                    item = self.triage_stack[int(src_str.split('.')[0])]['notes'].pop(int(src_str.split('.')[1])) if '.' in src_str else self.triage_stack.pop(int(src_str))['line']
-                    self.triage_stack[dest_idx]['notes'].append(item)
+                    if '.' in src_str:
+                        src = self.triage_stack[int(src_str.split('.')[0])]
+                        dest = self.triage_stack[dest_idx]
+                        self._touch_stack(src, dest)
+                        item = src['notes'].pop(int(src_str.split('.')[1]))
+                    else:
+                        src = self.triage_stack.pop(int(src_str))
+                        dest = self.triage_stack[dest_idx]
+                        self._touch_stack(dest, removed=(src,))
+                        item = src['line']
+                    dest['notes'].append(item)
                 elif base_cmd == 'e':
                     idx = int(parts[1]) if len(parts) > 1 else 0
                     if 0 <= idx < len(self.triage_stack):
-                        self.triage_stack[idx] = self._edit_item(self.triage_stack[idx])
-                        self.initial_stack = copy.deepcopy(self.triage_stack)
+                        old = self.triage_stack[idx]
+                        self.triage_stack[idx] = self._edit_item(old)
+                        self._touch_stack(added=(self.triage_stack[idx],), removed=(old,))
+                        self.initial_stack = self._snapshot_stack()
 
                 elif base_cmd == 'b':
                     duration = 5
@@ -1852,6 +3091,21 @@ class FocusCLI:
                     if self._handle_defer_command(base_cmd, parts):
                         return
 
+                elif base_cmd == 'j':
+                    self.triage_scroll = int(parts[1]) if len(parts) > 1 else 0
+                elif base_cmd == 'd':
+                    self.triage_scroll = min(self.triage_scroll + self.triage_page, max(0, len(self.triage_stack) - 1))
+                elif base_cmd == 'u':
+                    self.triage_scroll = max(0, self.triage_scroll - self.triage_page)
+                elif base_cmd == 'o':
+                    if len(parts) > 1:
+                        item = self.triage_stack[int(parts[1])]
+                        if self.expanded_notes.pop(id(item), None) is None:
+                            self.expanded_notes[id(item)] = item
+                    else:
+                        self.expand_all_notes = not self.expand_all_notes
+                        self.expanded_notes.clear()
+
             elif self.mode in ["FOCUS", "BREAK"]:
                 if not self.triage_stack:
                     if base_cmd == 'q':
@@ -1860,7 +3114,7 @@ class FocusCLI:
                         return
 
                 top_task = self.triage_stack[0]
-                focus_item, parent_item, focus_path = self._get_recursive_focus(top_task)
+                focus_item, parent_item, focus_path = self._get_focus(top_task)
                 is_note = not focus_item['line'].startswith('[]')
 
                 if base_cmd == 'b' and self.mode == "FOCUS":
@@ -1890,7 +3144,7 @@ class FocusCLI:
                     new_item = self._edit_item(focus_item)
                     if new_item != focus_item:
                         self._update_recursive_item(top_task, focus_path, new_item)
-                        self.initial_stack = copy.deepcopy(self.triage_stack)
+                        self.initial_stack = self._snapshot_stack()
                     return
 
                 if base_cmd == 'm' and self.mode == "FOCUS":
@@ -1929,6 +3183,7 @@ class FocusCLI:
                         return
                     idx = int(match_x.group(1))
                     if 0 <= idx < len(focus_item['notes']):
+                        self._touch_stack(top_task)
                         focus_item['notes'][idx] = re.sub(r'^\[\s?\]', '[x]', focus_item['notes'][idx])
                         self._update_recursive_item(top_task, focus_path, focus_item)
                         if self.mini_timer_active:
@@ -1943,12 +3198,13 @@ class FocusCLI:
                         return
                     # Notes are always top-level in triage_stack if they were returned as focus_item with empty path
                     if not focus_path:
-                        self.triage_stack.pop(0)
+                        note = self.triage_stack.pop(0)
+                        self._touch_stack(removed=(note,))
                     else:
                         # This shouldn't happen with current recursive logic but let's be safe
                         pass
                     self.task_start_time = None
-                    self.initial_stack = copy.deepcopy(self.triage_stack)
+                    self.initial_stack = self._snapshot_stack()
                     return
 
                 if base_cmd in ['x', '-', '>', '>>', 'i']:
@@ -1969,6 +3225,7 @@ class FocusCLI:
                     
                     if not focus_path:
                         item_to_record = self.triage_stack.pop(0)
+                        self._touch_stack(removed=(item_to_record,))
                         # Ensure we commit the RESOLVED version
                         resolved_top = self._prepare_task_with_markers(item_to_record, marker, marker)
                         self.commit_to_ledger(ledger_label, [resolved_top])
@@ -1991,7 +3248,7 @@ class FocusCLI:
                         self.mini_timer_last_tick = time.time()
                         self.mini_timer_last_chime_timestamp = 0
                     self.task_start_time = None
-                    self.initial_stack = copy.deepcopy(self.triage_stack)
+                    self.initial_stack = self._snapshot_stack()
 
                     if not self.triage_stack and self.mode == "FOCUS":
                         self.commit_to_ledger("Focus Session Complete", [])
@@ -2002,5 +3259,39 @@ class FocusCLI:
             self.last_msg = f"Error: {e}"
         return None
 
-if __name__ == "__main__":
+def main():
+    if 'search' in CLI_OPTIONS:
+        cli = FocusCLI()
+        for hit in cli.search(CLI_OPTIONS['search']):
+            print(searchindex.format_hit(hit))
+        cli.search_index.save()
+        return
+    if 'summary' in CLI_OPTIONS:
+        dates = parse_date_range(CLI_OPTIONS['summary'])
+        if dates is None:
+            sys.exit(f"Invalid --summary range '{CLI_OPTIONS['summary']}', expected YYYYMMDD..YYYYMMDD")
+        summary, files = FocusCLI().get_range_summary(*dates)
+        start, end = (d.strftime(DATE_FORMAT) for d in dates)
+        print_scorecard(f"SCORECARD {start}..{end} ({files} files)", summary)
+        return
+    if 'sync-db' in CLI_OPTIONS:
+        path = CLI_OPTIONS['sync-db'] if CLI_OPTIONS['sync-db'] is not True else LEDGER_DB or ledgerdb.DB_NAME
+        mirror = ledgerdb.LedgerMirror(path, os.path.dirname(os.path.abspath(FILENAME)))
+        try:
+            files = mirror.sync([os.path.basename(FILENAME)])
+        finally:
+            mirror.close()
+        print(f"Synced {files} changed file(s) to {path}")
+        return
+    if 'time' in CLI_OPTIONS:
+        dates = parse_date_range(CLI_OPTIONS['time'])
+        if dates is None:
+            sys.exit(f"Invalid --time range '{CLI_OPTIONS['time']}', expected YYYYMMDD..YYYYMMDD")
+        totals, files = FocusCLI().get_focus_times(*dates)
+        start, end = (d.strftime(DATE_FORMAT) for d in dates)
+        print_focus_times(f"FOCUSED TIME {start}..{end} ({files} files)", totals)
+        return
     FocusCLI().run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Optional SQLite mirror of the plan file ledgers, for ad-hoc queries.
+
+The text files stay the source of truth. Each file is mirrored from the byte
+offset reached last time, checked against a CRC of what was already
+mirrored; a file changed before that point is mirrored again from the start.
+
+Tables:
+- markers: one row per ------- marker line, with its label and timestamp.
+- lines: every task and note line, with its marker, indentation level, task
+  state ('' pending, 'x', '-', '>', 'e'; NULL for notes), content and parent
+  path ("Task > Subtask", as in the scorecard).
+- resolutions (view): lines that finish, cancel or defer a task, with their
+  marker's label and timestamp.
+"""
+import json
+import os
+import re
+import sqlite3
+import zlib
+from datetime import datetime
+
+import ledgerio
+
+DB_NAME = "focus.db"
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE files (
+    name TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL, -- End of the last complete line mirrored
+    crc INTEGER NOT NULL, -- Over [0, offset)
+    mtime INTEGER,
+    marker_id INTEGER, -- Marker the next line falls under
+    stack TEXT NOT NULL -- JSON path of the last line, to resume mid-file
+);
+CREATE TABLE markers (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    timestamp TEXT -- YYYY-MM-DD HH:MM:SS, NULL if the marker has none
+);
+CREATE TABLE lines (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    marker_id INTEGER REFERENCES markers(id),
+    level INTEGER NOT NULL,
+    state TEXT,
+    content TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX markers_file ON markers(file, offset);
+CREATE INDEX markers_label ON markers(label, timestamp);
+CREATE INDEX markers_timestamp ON markers(timestamp);
+CREATE INDEX lines_file ON lines(file, offset);
+CREATE INDEX lines_marker ON lines(marker_id);
+CREATE INDEX lines_path ON lines(path);
+CREATE INDEX lines_state ON lines(state);
+CREATE VIEW resolutions AS
+    SELECT lines.*, markers.label, markers.timestamp
+    FROM lines JOIN markers ON markers.id = lines.marker_id
+    WHERE lines.state IN ('x', '-', '>');
+"""
+MARKER_LINE_RE = re.compile(r'^------- (.*?)(?: (\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2} [AP]M))? -------$')
+TIMESTAMP_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+LINE_MARKER_RE = re.compile(r'^\[([xe\->\s]?)\]\s*')
+
+class LedgerMirror:
+    """The SQLite mirror of the plan files of one directory."""
+
+    def __init__(self, path, directory):
+        self.directory = directory
+        self.conn = sqlite3.connect(path)
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.conn:
+                for kind, name in self.conn.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'view')").fetchall():
+                    self.conn.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+                self.conn.executescript(SCHEMA)
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.conn.close()
+
+    def sync(self, names=()):
+        """Mirrors what changed in the daily plan files, plus any other names given, in one transaction.
+
+        Returns the number of files that had something new.
+        """
+        with self.conn:
+            return sum(self._sync_file(name) for name in sorted(set(ledgerio.plan_files(self.directory)) | set(names)))
+
+    def sync_file(self, name):
+        with self.conn:
+            return self._sync_file(name)
+
+    def append(self, name, data, before, after):
+        """Mirrors bytes just appended to a file, given its stat results before and after the write.
+
+        Falls back to syncing the file itself when the mirror was not current
+        for it before the write.
+        """
+        state = self._get_state(name)
+        if state is None or before is None or before.st_size != state['offset'] or before.st_mtime_ns != state['mtime']:
+            self.sync_file(name)
+            return
+        with self.conn:
+            self._feed(name, state, data, 0)
+            state['mtime'] = after.st_mtime_ns
+            self._put_state(name, state)
+
+    def _get_state(self, name):
+        row = self.conn.execute("SELECT offset, crc, mtime, marker_id, stack FROM files WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        offset, crc, mtime, marker_id, stack = row
+        return {'offset': offset, 'crc': crc, 'mtime': mtime, 'marker_id': marker_id, 'stack': json.loads(stack)}
+
+    def _put_state(self, name, state):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (name, offset, crc, mtime, marker_id, stack) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, state['offset'], state['crc'], state['mtime'], state['marker_id'], json.dumps(state['stack'])))
+
+    def _sync_file(self, name):
+        path = os.path.join(self.directory, name)
+        state = self._get_state(name)
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            if state is not None:
+                self._forget(name)
+                self.conn.execute("DELETE FROM files WHERE name = ?", (name,))
+            return False
+        with f:
+            st = os.fstat(f.fileno())
+            if state is not None and st.st_size == state['offset'] and st.st_mtime_ns == state['mtime']:
+                return False
+            with ledgerio.mapped(f) as buf:
+                if state is None or not self._is_prefix_intact(buf, state):
+                    if state is not None:
+                        self._forget(name)
+                    state = {'offset': 0, 'crc': 0, 'mtime': None, 'marker_id': None, 'stack': []}
+                self._feed(name, state, buf, state['offset'])
+        state['mtime'] = st.st_mtime_ns
+        self._put_state(name, state)
+        return True
+
+    def _is_prefix_intact(self, buf, state):
+        if len(buf) < state['offset']:
+            return False
+        with memoryview(buf) as view:
+            return zlib.crc32(view[:state['offset']]) == state['crc']
+
+    def _forget(self, name):
+        self.conn.execute("DELETE FROM lines WHERE file = ?", (name,))
+        self.conn.execute("DELETE FROM markers WHERE file = ?", (name,))
+
+    def _feed(self, name, state, buf, start):
+        """Inserts the complete lines of buf from start, which sits at state['offset'] in the file."""
+        end = buf.rfind(b"\n", start) + 1
+        if end <= start:
+            return
+        base = state['offset'] - start
+        marker_id = state['marker_id']
+        stack = state['stack']
+        # Marker ids are assigned here so both tables can be filled with one executemany each
+        next_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM markers").fetchone()[0]
+        markers = []
+        rows = []
+        with memoryview(buf) as view:
+            for s, e in ledgerio.iter_spans(buf, start):
+                if s >= end:
+                    break
+                line_raw = ledgerio.decode(view[s:e])
+                if ledgerio.is_marker(buf, s, e):
+                    m = MARKER_LINE_RE.match(line_raw.strip())
+                    label, timestamp = (m.group(1), m.group(2)) if m else (line_raw.strip().strip("- "), None)
+                    if timestamp:
+                        try:
+                            timestamp = datetime.strptime(timestamp, TIMESTAMP_FORMAT).strftime('%Y-%m-%d %H:%M:%S')
+                        except ValueError:
+                            timestamp = None
+                    marker_id = next_id
+                    next_id += 1
+                    markers.append((marker_id, name, base + s, label, timestamp))
+                    del stack[:]
+                    continue
+                if not line_raw.strip():
+                    continue
+
+                level = (len(line_raw) - len(line_raw.lstrip())) // 2
+                del stack[level:]
+                while len(stack) < level:
+                    stack.append("")
+                clean = line_raw.strip()
+                m = LINE_MARKER_RE.match(clean)
+                content = clean[m.end():].strip() if m else clean
+                path = " > ".join(stack + [content])
+                stack.append(content)
+                rows.append((name, base + s, marker_id, level, m.group(1).strip() if m else None, content, path))
+            state['crc'] = zlib.crc32(view[start:end], state['crc'])
+        self.conn.executemany("INSERT INTO markers (id, file, offset, label, timestamp) VALUES (?, ?, ?, ?, ?)", markers)
+        self.conn.executemany(
+            "INSERT INTO lines (file, offset, marker_id, level, state, content, path) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        state['marker_id'] = marker_id
+        state['offset'] += end - start
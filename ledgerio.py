@@ -0,0 +1,66 @@
+"""Line-level access to ledger files without reading them into Python strings.
+
+The file is memory-mapped and walked as byte spans; a line only becomes a
+str when a caller decodes it, and marker lines are never decoded here. Used by
+focuscli's parsers and migrate_ledger.
+"""
+import contextlib
+import mmap
+import os
+import re
+
+MARKER = b"-------"
+PLAN_FILE_RE = re.compile(r'^\d{8}-plan\.txt$')
+
+def plan_files(directory):
+    """Names of the daily plan files (YYYYMMDD-plan.txt) in directory, oldest first."""
+    try:
+        return sorted(name for name in os.listdir(directory) if PLAN_FILE_RE.match(name))
+    except OSError:
+        return []
+
+@contextlib.contextmanager
+def mapped(f):
+    """Maps an open binary file read-only. Yields b"" for an empty file, which mmap rejects."""
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b""
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        yield m
+
+def iter_spans(buf, start=0):
+    """Yields (start, end) offsets of each line in buf from start, excluding the newline."""
+    end = len(buf)
+    pos = start
+    while pos < end:
+        nl = buf.find(b"\n", pos)
+        if nl == -1:
+            yield pos, end
+            return
+        yield pos, nl
+        pos = nl + 1
+
+def is_marker(buf, start, end):
+    """True if the line at buf[start:end] contains a ------- divider."""
+    return buf.find(MARKER, start, end) != -1
+
+def decode(line):
+    """Decodes a line view the way the ledger parsers expect: UTF-8, trailing whitespace removed."""
+    return str(line, 'utf-8', 'replace').rstrip()
+
+def iter_text_lines(buf, start=0):
+    """Yields each line of buf from start, decoding one line at a time.
+
+    Marker lines are found on the raw bytes and yielded undecoded, as bytes
+    with trailing whitespace removed; every other line is a str, so callers
+    tell markers apart by type.
+    """
+    view = memoryview(buf)
+    try:
+        for s, e in iter_spans(buf, start):
+            if is_marker(buf, s, e):
+                yield bytes(view[s:e]).rstrip()
+            else:
+                yield decode(view[s:e])
+    finally:
+        view.release()
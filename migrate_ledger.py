@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 import os
 import re
+import shutil
 import sys
 
+import ledgerio
+
 # List of currently recognized marker labels (from both Focus and Work eras)
 RECOGNIZED_LABELS = [
     "Free Write",
     "Triage Session Started at",
     "Triage",
+    "Triage Delta",
+    "Triage Checkpoint",
+    "Triage Removed",
     "Work",
     "Focus",
     "New Entry(s)",
@@ -36,18 +42,16 @@ RECOGNIZED_LABELS = [
     "DEEP WORK SESSION"
 ]
 
-def migrate_file(filepath):
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-
-    print(f"Validating {filepath}...")
-
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
+def find_unrecognized_markers(buf):
+    """Returns (line number, text) of marker lines whose label is not recognized.
 
+    Only lines containing a ------- divider are decoded.
+    """
     unrecognized = []
-    for i, line in enumerate(lines):
+    for i, (start, end) in enumerate(ledgerio.iter_spans(buf)):
+        if not ledgerio.is_marker(buf, start, end):
+            continue
+        line = buf[start:end].decode('utf-8', errors='replace')
         # Match marker format: ------- LABEL [TIMESTAMP] -------
         # First handle the "at" variations for Triage Session Started at, Work Session Re-started at, etc.
         m_at = re.match(r'^\s*------- (.*? Session (?:Started|Re-started) at) (?:[0-9/:\sAPM]+) -------\s*$', line)
@@ -71,6 +75,17 @@ def migrate_file(filepath):
 
             if label_for_check not in RECOGNIZED_LABELS:
                 unrecognized.append((i + 1, line.strip()))
+    return unrecognized
+
+def migrate_file(filepath):
+    if not os.path.exists(filepath):
+        print(f"File not found: {filepath}")
+        return
+
+    print(f"Validating {filepath}...")
+
+    with open(filepath, 'rb') as f, ledgerio.mapped(f) as buf:
+        unrecognized = find_unrecognized_markers(buf)
 
     if unrecognized:
         print(f"Aborting! Unrecognized markers found in {filepath}:")
@@ -81,7 +96,6 @@ def migrate_file(filepath):
 
     print(f"Migrating {filepath}...")
 
-    new_lines = []
     replacements = [
         (r'------- Work (.*) -------', r'------- Focus \1 -------'),
         (r'------- Work Session Complete (.*) -------', r'------- Focus Session Complete \1 -------'),
@@ -91,24 +105,36 @@ def migrate_file(filepath):
         (r'------- Prioritized Task (.*) -------', r'------- Prioritized Entry(s) \1 -------'),
     ]
 
+    # Only marker lines can change; everything else is copied through as bytes
     count = 0
-    for line in lines:
-        new_line = line
-        for pattern, replacement in replacements:
-            new_line, n = re.subn(pattern, replacement, new_line)
-            count += n
-        new_lines.append(new_line)
+    tmp_path = filepath + ".tmp"
+    with open(filepath, 'rb') as f, ledgerio.mapped(f) as buf, open(tmp_path, 'wb') as out:
+        view = memoryview(buf)
+        try:
+            for start, end in ledgerio.iter_spans(buf):
+                if ledgerio.is_marker(buf, start, end):
+                    line = str(view[start:end], 'utf-8', 'replace')
+                    for pattern, replacement in replacements:
+                        line, n = re.subn(pattern, replacement, line)
+                        count += n
+                    out.write(line.encode('utf-8'))
+                else:
+                    out.write(view[start:end])
+                if end < len(buf):
+                    out.write(b"\n")
+        finally:
+            view.release()
 
     if count > 0:
         backup_path = filepath + ".bak"
-        with open(backup_path, 'w') as f:
-            f.writelines(lines)
-
-        with open(filepath, 'w') as f:
-            f.writelines(new_lines)
+        shutil.copyfile(filepath, backup_path)
+        # The rewritten file keeps the original's permissions
+        shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
 
         print(f"Successfully migrated {count} markers. Backup created at {backup_path}")
     else:
+        os.remove(tmp_path)
         print("No markers found to migrate.")
 
 if __name__ == "__main__":
@@ -0,0 +1,233 @@
+"""Inverted index over the task and note text of the plan files in a directory.
+
+The index is kept as one segment per plan file, in .{name}.index next to the
+file, holding that file's hits and token postings. A hit is the latest
+appearance of a line in one file: the timestamp of the marker it was listed
+under and its task path (the marker-free text of the line and of each parent
+above it). Files are indexed from the byte offset reached last time, so only
+appended text is read; a file changed before that offset has its segment
+rebuilt from the start. Only the segments of files that changed are written.
+"""
+import contextlib
+import json
+import os
+import re
+import zlib
+from datetime import datetime
+
+import ledgerio
+
+INDEX_VERSION = 2
+TOKEN_RE = re.compile(r'\w+')
+LINE_MARKER_RE = re.compile(r'^\[([xe\->\s]?)\]\s*')
+MARKER_TIMESTAMP_RE = re.compile(rb'(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2} [AP]M) -------')
+TIMESTAMP_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+def tokenize(text):
+    """Splits text into the lower-cased words the index is keyed by."""
+    return TOKEN_RE.findall(text.lower())
+
+def segment_path(directory, name):
+    """Path of the index segment for the plan file name in directory."""
+    return os.path.join(directory, f".{name}.index")
+
+def _new_segment():
+    return {
+        'offset': 0, # End of the last complete line indexed
+        'crc': 0, # Over [0, offset)
+        'mtime': None,
+        'timestamp': None, # Of the last marker seen
+        'stack': [], # Task path of the last line seen
+        'skipping': False, # Inside a Triage Removed block, which only names existing tasks
+        'hits': [], # [marker timestamp, task path, line]
+        'postings': {} # token -> hit ids
+    }
+
+class SearchIndex:
+    """Token -> hit postings for the plan files of one directory, one segment per file."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.files = {} # file name -> _new_segment()
+        self._hit_ids = {} # file name -> {task path: hit id}
+        self.dirty = set() # Names of the files whose segment changed since save()
+        self._removed = set() # Names of the files whose segment is to be deleted
+        for name in ledgerio.plan_files(directory):
+            self._load(name)
+
+    def _load(self, name):
+        """Loads the segment of one file, returning it or None when there is no usable one."""
+        try:
+            with open(segment_path(self.directory, name), 'r') as f:
+                segment = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if segment.pop('version', None) != INDEX_VERSION:
+            return None
+        self.files[name] = segment
+        self._hit_ids[name] = {tuple(hit[1]): i for i, hit in enumerate(segment['hits'])}
+        return segment
+
+    def save(self):
+        """Writes the segments that changed and deletes those of removed files."""
+        for name in self._removed:
+            with contextlib.suppress(OSError):
+                os.remove(segment_path(self.directory, name))
+        self._removed.clear()
+        for name in list(self.dirty):
+            path = segment_path(self.directory, name)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, 'w') as f:
+                    json.dump({'version': INDEX_VERSION, **self.files[name]}, f)
+                os.replace(tmp, path)
+            except OSError:
+                continue
+            self.dirty.discard(name)
+
+    def refresh(self, names=()):
+        """Brings the index up to date with the daily plan files plus any other names given.
+
+        Files indexed before are checked too, so the segments of removed ones are dropped.
+        """
+        for name in sorted(set(ledgerio.plan_files(self.directory)) | set(names) | set(self.files)):
+            self.update_file(name)
+
+    def update_file(self, name):
+        """Indexes whatever was appended to one file since it was last indexed."""
+        path = os.path.join(self.directory, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._forget(name)
+            return
+        segment = self.files.get(name)
+        if segment is None:
+            segment = self._load(name)
+        if segment is not None and st.st_size == segment['offset'] and st.st_mtime_ns == segment['mtime']:
+            return
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self._forget(name)
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            with ledgerio.mapped(f) as buf:
+                if segment is None or not self._is_prefix_intact(buf, segment):
+                    # Rebuilding replaces the whole segment, so no stale hits are left behind
+                    segment = self.files[name] = _new_segment()
+                    self._hit_ids[name] = {}
+                self._feed(name, segment, buf, segment['offset'])
+            segment['mtime'] = st.st_mtime_ns
+        self.dirty.add(name)
+
+    def append(self, name, data, before, after):
+        """Indexes bytes just appended to a file, given its stat results before and after the write.
+
+        Only applies when the index was current for the file before the write;
+        otherwise the next refresh() catches up from the file itself.
+        """
+        segment = self.files.get(name)
+        if segment is None or before is None or before.st_size != segment['offset'] or before.st_mtime_ns != segment['mtime']:
+            return
+        self._feed(name, segment, data, 0)
+        segment['mtime'] = after.st_mtime_ns
+        self.dirty.add(name)
+
+    def _is_prefix_intact(self, buf, segment):
+        if len(buf) < segment['offset']:
+            return False
+        with memoryview(buf) as view:
+            return zlib.crc32(view[:segment['offset']]) == segment['crc']
+
+    def _forget(self, name):
+        """Drops the segment of a file that no longer exists."""
+        self.files.pop(name, None)
+        self._hit_ids.pop(name, None)
+        self.dirty.discard(name)
+        if os.path.exists(segment_path(self.directory, name)):
+            self._removed.add(name)
+
+    def _feed(self, name, segment, buf, start):
+        """Indexes the complete lines of buf from start, advancing the segment past them."""
+        end = buf.rfind(b"\n", start) + 1
+        if end <= start:
+            return
+        timestamp = segment['timestamp']
+        stack = segment['stack']
+        skipping = segment['skipping']
+        with memoryview(buf) as view:
+            for s, e in ledgerio.iter_spans(buf, start):
+                if s >= end:
+                    break
+                if ledgerio.is_marker(buf, s, e):
+                    # Only the timestamp and label are needed, so markers are not decoded
+                    m = MARKER_TIMESTAMP_RE.search(buf, s, e)
+                    if m:
+                        timestamp = m.group(1).decode('ascii')
+                    skipping = buf.find(b"------- Triage Removed", s, e) != -1
+                elif not skipping:
+                    self._index_line(name, segment, ledgerio.decode(view[s:e]), timestamp, stack)
+            segment['crc'] = zlib.crc32(view[start:end], segment['crc'])
+        segment['timestamp'] = timestamp
+        segment['skipping'] = skipping
+        segment['offset'] += end - start
+
+    def _index_line(self, name, segment, line_raw, timestamp, stack):
+        """Adds one task or note line under its task path."""
+        if not line_raw.strip():
+            return
+
+        level = (len(line_raw) - len(line_raw.lstrip())) // 2
+        del stack[level:]
+        while len(stack) < level:
+            stack.append("")
+        line = line_raw.strip()
+        stack.append(LINE_MARKER_RE.sub('', line))
+        self._add_hit(name, segment, timestamp, tuple(stack), line)
+
+    def _add_hit(self, name, segment, timestamp, path, line):
+        hit_ids = self._hit_ids[name]
+        i = hit_ids.get(path)
+        if i is not None:
+            hit = segment['hits'][i]
+            hit[0] = timestamp
+            hit[2] = line
+            return
+        i = hit_ids[path] = len(segment['hits'])
+        segment['hits'].append([timestamp, list(path), line])
+        for token in set(tokenize(path[-1])):
+            segment['postings'].setdefault(token, []).append(i)
+
+    def query(self, text):
+        """Returns the hits whose line contains every word of text, most recent first.
+
+        Each hit is [file name, marker timestamp, task path, line].
+        """
+        tokens = set(tokenize(text))
+        if not tokens:
+            return []
+        hits = []
+        for name, segment in self.files.items():
+            postings = sorted((segment['postings'].get(token, []) for token in tokens), key=len)
+            ids = set(postings[0])
+            for posting in postings[1:]:
+                if not ids:
+                    break
+                ids.intersection_update(posting)
+            hits.extend([name] + segment['hits'][i] for i in ids)
+
+        def recency(hit):
+            try:
+                when = datetime.strptime(hit[1], TIMESTAMP_FORMAT) if hit[1] else datetime.min
+            except ValueError:
+                when = datetime.min
+            return (hit[0], when)
+        return sorted(hits, key=recency, reverse=True)
+
+def format_hit(hit):
+    """One-line display of a hit: file, marker timestamp and the task path down to the line."""
+    name, timestamp, path, line = hit
+    where = f"{name} {timestamp}" if timestamp else name
+    return f"{where}: {' > '.join(path[:-1] + [line])}"
@@ -0,0 +1,98 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import focuscli
+from focuscli import FocusCLI, DATE_FORMAT, normalize_task_text, task_token_key
+
+class TestDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.old_filename = focuscli.FILENAME
+        focuscli.FILENAME = datetime.now().strftime(f"{DATE_FORMAT}-plan.txt")
+        self.cli = FocusCLI()
+        self.cli.commit_to_ledger = lambda label, items: None
+        self.cli.mode = "TRIAGE"
+        self.cli.triage_stack = [
+            {'line': '[] Sync with Dana 2-3 PM', 'notes': ['[] Send  Agenda']},
+            {'line': '[x] Old task', 'notes': []}
+        ]
+
+    def tearDown(self):
+        focuscli.FILENAME = self.old_filename
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_normalization(self):
+        self.assertEqual(normalize_task_text("[]  SYNC with dana 2:00-3:00 pm "), "sync with dana")
+        self.assertEqual(task_token_key("review, budget: hermes"), task_token_key("hermes budget review"))
+
+    def test_exact_duplicate_is_flagged(self):
+        self.cli.handle_command('n "[] sync WITH dana 4 PM"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added | Duplicate of '[] Sync with Dana 2-3 PM' (today)")
+        self.assertEqual(len(self.cli.triage_stack), 3)
+
+        self.cli.handle_command('n "[] send agenda"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added | Duplicate of '[] Send  Agenda' (today)")
+
+    def test_near_duplicate_is_flagged(self):
+        self.cli.handle_command('n "[] Dana: sync with"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added | Similar to '[] Sync with Dana 2-3 PM' (today)")
+
+    def test_finished_and_new_tasks_are_not_flagged(self):
+        self.cli.handle_command('n "[] Old task"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added")
+
+    def test_mutations_update_index_in_place(self):
+        self.cli.handle_command('n "[] Task A"')
+
+        indexed = []
+        index_stack_item = self.cli._index_stack_item
+        def recording_index_stack_item(index, item):
+            indexed.append(item['line'])
+            index_stack_item(index, item)
+        self.cli._index_stack_item = recording_index_stack_item
+        self.cli.handle_command('N "[] task  a"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added & Prioritized | Duplicate of '[] Task A' (today)")
+        # Only the item added since the last check was indexed, not the whole stack again
+        self.assertEqual(indexed, ['[] Task A'])
+
+        # Removed and reordered items are followed too
+        indexed.clear()
+        self.cli.handle_command('p 1 0')
+        self.cli.handle_command('i 0')
+        self.cli.handle_command('n "[] Sync with Dana"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added")
+        self.assertEqual(indexed, ['[] task  a'])
+
+    def test_lookback_files_are_checked(self):
+        yesterday = (datetime.now() - timedelta(days=1)).strftime(f"{DATE_FORMAT}-plan.txt")
+        with open(yesterday, "w") as f:
+            f.write("[] Renew passport\n[x] File taxes\n[] Book flights\n")
+
+        self.cli.handle_command('n "[] renew passport"')
+        self.assertEqual(self.cli.last_msg, f"Task(s) Added | Duplicate of '[] Renew passport' ({yesterday})")
+        self.cli.handle_command('n "[] file taxes"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added")
+
+        # The lookback files are only looked at again after load_context()
+        with patch.object(self.cli, '_lookback_window', side_effect=AssertionError):
+            self.cli.handle_command('n "[] book flights"')
+        self.assertEqual(self.cli.last_msg, f"Task(s) Added | Duplicate of '[] Book flights' ({yesterday})")
+
+    def test_finished_lookback_files_are_not_parsed(self):
+        yesterday = (datetime.now() - timedelta(days=1)).strftime(f"{DATE_FORMAT}-plan.txt")
+        with open(yesterday, "w") as f:
+            f.write("[x] Renew passport\n")
+        self.cli._set_manifest_entry(yesterday, False)
+
+        with patch.object(self.cli, '_parse_file', side_effect=AssertionError):
+            self.cli.handle_command('n "[] renew passport"')
+        self.assertEqual(self.cli.last_msg, "Task(s) Added")
+
+if __name__ == '__main__':
+    unittest.main()
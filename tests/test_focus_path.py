@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+
+# Ensure the root directory is in sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+class TestFocusPath(unittest.TestCase):
+    def setUp(self):
+        self.cli = FocusCLI()
+
+    def test_focus_path(self):
+        item = {'line': '[] Task 1', 'notes': [
+            '[x] Sub 1',
+            '  Note A',
+            '[] Sub 2',
+            '  [] Sub 2.1'
+        ]}
+        focus, parent, path = self.cli._get_recursive_focus(item)
+
+        self.assertEqual(focus, {'line': '[] Sub 2.1', 'notes': []})
+        self.assertEqual(parent['line'], '[] Sub 2')
+        self.assertEqual(path, [2, 0])
+
+    def test_set_and_prune_along_path(self):
+        item = {'line': '[] Task 1', 'notes': [
+            '[] Sub 1',
+            '  Note 1',
+            '  [] Sub 1.1',
+            '[] Sub 2'
+        ]}
+        self.cli._recursive_set(item, [0, 1], {'line': '[x] Sub 1.1', 'notes': []})
+        self.assertEqual(item['notes'], ['[] Sub 1', '  Note 1', '  [x] Sub 1.1', '[] Sub 2'])
+
+        pruned = self.cli._get_path_pruned_item(item, [0, 1])
+        self.assertEqual(pruned['notes'], ['[] Sub 1', '  Note 1', '  [x] Sub 1.1'])
+
+    def test_focus_cache_invalidated_by_mutation(self):
+        self.cli.commit_to_ledger = lambda label, items: None
+        self.cli.mode = "FOCUS"
+        self.cli.triage_stack = [{'line': '[] Task 1', 'notes': ['[] Sub 1', '[] Sub 2']}]
+        top = self.cli.triage_stack[0]
+
+        first = self.cli._get_focus(top)
+        self.assertIs(self.cli._get_focus(top), first)
+        self.assertEqual(first[0]['line'], '[] Sub 1')
+
+        self.cli.handle_command('x')
+        self.assertEqual(self.cli._get_focus(top)[0]['line'], '[] Sub 2')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from focuscli import FocusCLI
+
+class TestIncrementalParse(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.cli = FocusCLI()
+        self.path = "test-plan.txt"
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def _fresh_parse(self):
+        return FocusCLI()._parse_file(self.path)
+
+    def test_append_only_parses_tail(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n")
+            f.write("  [] Subtask 1\n")
+            f.write("Note A\n")
+        self.cli._parse_file(self.path)
+        offset = self.cli._parse_states[self.path]['offset']
+
+        with open(self.path, "a") as f:
+            f.write("\n------- Triage 01/01/2026 09:00:00 AM -------\n")
+            f.write("[] Task 2\n")
+            f.write("[] Task 1\n")
+            f.write("  [x] Subtask 1\n")
+
+        stack = self.cli._parse_file(self.path)
+        self.assertGreater(self.cli._parse_states[self.path]['offset'], offset)
+        self.assertEqual(stack, self._fresh_parse())
+        self.assertEqual(stack, [
+            {'line': '[] Task 2', 'notes': []},
+            {'line': '[] Task 1', 'notes': ['[x] Subtask 1']}
+        ])
+
+    def test_changed_prefix_triggers_full_parse(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n")
+            f.write("[] Task 2\n")
+        self.cli._parse_file(self.path)
+
+        # Same length rewrite of an earlier line followed by an append
+        with open(self.path, "w") as f:
+            f.write("[] Task 9\n")
+            f.write("[] Task 2\n")
+            f.write("[] Task 3\n")
+
+        self.assertEqual(self.cli._parse_file(self.path), self._fresh_parse())
+
+    def test_shrunk_file_triggers_full_parse(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n")
+            f.write("[] Task 2\n")
+        self.cli._parse_file(self.path)
+
+        with open(self.path, "w") as f:
+            f.write("[] Task 3\n")
+
+        self.assertEqual(self.cli._parse_file(self.path), [{'line': '[] Task 3', 'notes': []}])
+
+    def test_extended_partial_line(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n[] Half")
+        self.cli._parse_file(self.path)
+
+        with open(self.path, "a") as f:
+            f.write(" Written\n")
+
+        stack = self.cli._parse_file(self.path)
+        self.assertEqual([t['line'] for t in stack], ['[] Task 1', '[] Half Written'])
+
+    def test_returned_stack_does_not_alias_state(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n  Note 1\n")
+        stack = self.cli._parse_file(self.path)
+        stack[0]['notes'].append("Mutated")
+
+        self.assertEqual(self.cli._parse_file(self.path)[0]['notes'], ['Note 1'])
+
+    def test_sidecar_cache_is_reused(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n  Note 1\nLoose note\n")
+        expected = self.cli._parse_file(self.path)
+        self.cli.save_sidecars()
+        self.assertTrue(os.path.exists(".test-plan.txt.cache"))
+
+        other = FocusCLI()
+        other._parse_lines = None # Would raise if the file were reparsed
+        self.assertEqual(other._parse_file(self.path), expected)
+
+    def test_commit_keeps_cache_warm(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n")
+        self.cli._parse_file(self.path)
+        self.cli.commit_to_ledger("Triage", [{'line': '[] Task 2', 'notes': ['[] Sub']}], target_file=self.path)
+
+        other = FocusCLI()
+        state = other._load_parse_cache(self.path)
+        self.assertEqual(state['offset'], os.path.getsize(self.path))
+        self.assertEqual(other._parse_file(self.path), self._fresh_parse_without_cache())
+
+    def test_stale_cache_after_external_edit(self):
+        with open(self.path, "w") as f:
+            f.write("[] Task 1\n")
+        self.cli._parse_file(self.path)
+        with open(self.path, "w") as f:
+            f.write("[] Task 2\n")
+
+        self.assertEqual(FocusCLI()._parse_file(self.path), [{'line': '[] Task 2', 'notes': []}])
+
+    def test_parse_starts_at_last_checkpoint(self):
+        history = "".join(f"[] Old {i}\n  Note {i}\n" for i in range(200))
+        checkpoint = "\n------- Triage Checkpoint 01/01/2026 09:00:00 AM -------\n"
+        with open(self.path, "w") as f:
+            f.write(history)
+            f.write("\n------- Triage Checkpoint 01/01/2026 08:00:00 AM -------\n[] Older\n")
+            f.write(checkpoint)
+            f.write("[] Task 1\n  [] Sub 1\n[] Task 2\n")
+            f.write("\n------- Task Completed 01/01/2026 09:05:00 AM -------\n")
+            f.write("[] Task 1\n  [x] Sub 1\n")
+            f.write("[x] Task 2\n")
+
+        replayed = []
+        parse_lines = self.cli._parse_lines
+        def recording_parse_lines(lines, state):
+            lines = list(lines)
+            replayed.extend(lines)
+            parse_lines(lines, state)
+        self.cli._parse_lines = recording_parse_lines
+        # A small block size makes the marker straddle block boundaries
+        with patch('focuscli.LEDGER_SCAN_BLOCK', 7):
+            stack = self.cli._parse_file(self.path)
+
+        self.assertEqual(stack, [{'line': '[] Task 1', 'notes': ['[x] Sub 1']}])
+        with open(self.path) as f:
+            self.assertEqual(self.cli._parse_states[self.path]['base'], f.read().rindex(checkpoint.strip()))
+        self.assertNotIn("[] Old 0", replayed)
+
+    def test_checkpoint_on_first_line(self):
+        with open(self.path, "w") as f:
+            f.write("------- Triage Checkpoint 01/01/2026 09:00:00 AM -------\n[] Task 1\n")
+        self.assertEqual(self.cli._parse_file(self.path), [{'line': '[] Task 1', 'notes': []}])
+
+    def test_edit_before_checkpoint_keeps_state(self):
+        with open(self.path, "w") as f:
+            f.write("[] Old\n\n------- Triage Checkpoint 01/01/2026 09:00:00 AM -------\n[] Task 1\n")
+        self.cli._parse_file(self.path)
+        with open(self.path, "r+") as f:
+            f.write("[] New")
+
+        with open(self.path, "a") as f:
+            f.write("[] Task 2\n")
+        self.assertEqual([t['line'] for t in self.cli._parse_file(self.path)], ['[] Task 1', '[] Task 2'])
+
+    def _fresh_parse_without_cache(self):
+        os.remove(".test-plan.txt.cache")
+        return self._fresh_parse()
+
+if __name__ == '__main__':
+    unittest.main()
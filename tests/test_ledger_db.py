@@ -0,0 +1,90 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+import focuscli
+from focuscli import FocusCLI, parse_cli_args
+from ledgerdb import LedgerMirror
+
+class TestLedgerDB(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.old_filename = focuscli.FILENAME
+        focuscli.FILENAME = "20260102-plan.txt"
+        with open("20260101-plan.txt", "w") as f:
+            f.write("[] Project A\n  Note\n  [] Step 1\n")
+            f.write("\n------- Task Completed 01/01/2026 10:00:00 AM -------\n")
+            f.write("[] Project A\n  [x] Step 1\n")
+        self.mirror = LedgerMirror("test.db", self.test_dir)
+
+    def tearDown(self):
+        self.mirror.close()
+        focuscli.FILENAME = self.old_filename
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def query(self, sql, *args):
+        return self.mirror.conn.execute(sql, args).fetchall()
+
+    def test_sync_mirrors_markers_lines_and_resolutions(self):
+        self.assertEqual(self.mirror.sync(), 1)
+        self.assertEqual(self.query("SELECT file, label, timestamp FROM markers"),
+                         [("20260101-plan.txt", "Task Completed", "2026-01-01 10:00:00")])
+        self.assertEqual(self.query("SELECT level, state, path FROM lines WHERE marker_id IS NULL ORDER BY offset"), [
+            (0, "", "Project A"),
+            (1, None, "Project A > Note"),
+            (1, "", "Project A > Step 1")
+        ])
+        self.assertEqual(self.query("SELECT path, state, label FROM resolutions"),
+                         [("Project A > Step 1", "x", "Task Completed")])
+        self.assertEqual(self.mirror.sync(), 0)
+
+    def test_appends_are_synced_from_last_offset(self):
+        self.mirror.sync()
+        with open("20260101-plan.txt", "a") as f:
+            f.write("  [] Step 2\n[] Half")
+        self.mirror.sync()
+        # The partial line waits until it is complete; Step 2 stays under its parent and marker
+        self.assertEqual(self.query("SELECT path, label FROM lines JOIN markers ON markers.id = marker_id WHERE content = 'Step 2'"),
+                         [("Project A > Step 2", "Task Completed")])
+        self.assertEqual(self.query("SELECT COUNT(*) FROM lines WHERE content LIKE 'Half%'"), [(0,)])
+
+        with open("20260101-plan.txt", "a") as f:
+            f.write(" Done\n")
+        self.mirror.sync()
+        self.assertEqual(self.query("SELECT content FROM lines WHERE content LIKE 'Half%'"), [("Half Done",)])
+        self.assertEqual(self.query("SELECT COUNT(*) FROM lines"), [(7,)])
+
+    def test_rewritten_file_is_mirrored_again(self):
+        self.mirror.sync()
+        with open("20260101-plan.txt", "w") as f:
+            f.write("[] Other\n")
+        self.mirror.sync()
+        self.assertEqual(self.query("SELECT path FROM lines"), [("Other",)])
+        self.assertEqual(self.query("SELECT COUNT(*) FROM markers"), [(0,)])
+
+    def test_commits_feed_the_mirror(self):
+        with patch('focuscli.LEDGER_DB', os.path.join(self.test_dir, "test.db")):
+            cli = FocusCLI()
+            cli.commit_to_ledger("New Entry(s)", [{'line': '[] Task 1', 'notes': ['[] Sub']}])
+            cli.commit_to_ledger("Task Completed", [{'line': '[] Task 1', 'notes': ['[x] Sub']}])
+            cli.ledger.flush()
+            cli.mirror.close()
+
+        self.assertEqual(self.query("SELECT offset FROM files WHERE name = ?", focuscli.FILENAME),
+                         [(os.path.getsize(focuscli.FILENAME),)])
+        self.assertEqual(self.query("SELECT path, label FROM resolutions"), [("Task 1 > Sub", "Task Completed")])
+
+    def test_sync_db_cli_args(self):
+        self.assertEqual(parse_cli_args(["--sync-db"]), (None, {'sync-db': True}))
+        self.assertEqual(parse_cli_args(["--sync-db", "mirror.db"]), (None, {'sync-db': "mirror.db"}))
+        self.assertEqual(parse_cli_args(["--sync-db", "mirror.db", "plan.txt"]), ("plan.txt", {'sync-db': "mirror.db"}))
+        # A plan file or another option after it is not taken as the path
+        self.assertEqual(parse_cli_args(["--sync-db", "plan.txt"]), ("plan.txt", {'sync-db': True}))
+        self.assertEqual(parse_cli_args(["--sync-db", "--search", "x"]), (None, {'sync-db': True, 'search': "x"}))
+
+if __name__ == '__main__':
+    unittest.main()
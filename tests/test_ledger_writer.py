@@ -0,0 +1,123 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from focuscli import FocusCLI, LedgerWriter
+
+class TestLedgerWriter(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "test-plan.txt")
+        self.writes = []
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _writer(self, durability="flush"):
+        def on_write(path, data, write):
+            self.writes.append(data)
+            write()
+        writer = LedgerWriter(durability, on_write=on_write)
+        self.addCleanup(writer.close)
+        return writer
+
+    def _read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_batch_groups_appends_into_one_write(self):
+        writer = self._writer()
+        with writer.batch():
+            writer.append(self.path, b"one\n")
+            with writer.batch():
+                writer.append(self.path, b"two\n")
+            self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.writes, [b"one\ntwo\n"])
+        self.assertEqual(self._read(), b"one\ntwo\n")
+
+    def test_append_outside_batch_is_written_at_once(self):
+        writer = self._writer()
+        writer.append(self.path, b"one\n")
+        self.assertEqual(self._read(), b"one\n")
+
+    def test_none_mode_buffers_until_flush(self):
+        writer = self._writer("none")
+        with writer.batch():
+            writer.append(self.path, b"one\n")
+        self.assertFalse(os.path.exists(self.path))
+        writer.flush()
+        self.assertEqual(self._read(), b"one\n")
+
+    def test_fsync_mode_syncs_each_batch(self):
+        writer = self._writer("fsync")
+        with patch('focuscli.os.fsync') as fsync:
+            with writer.batch():
+                writer.append(self.path, b"one\n")
+                writer.append(self.path, b"two\n")
+        fsync.assert_called_once()
+
+    def test_reopens_replaced_file(self):
+        writer = self._writer()
+        writer.append(self.path, b"one\n")
+        # Editors may save by writing a new file over the old one
+        replacement = self.path + ".new"
+        with open(replacement, 'wb') as f:
+            f.write(b"edited\n")
+        os.replace(replacement, self.path)
+
+        writer.append(self.path, b"two\n")
+        self.assertEqual(self._read(), b"edited\ntwo\n")
+
+    def test_rejects_unknown_durability(self):
+        with self.assertRaises(ValueError):
+            LedgerWriter("sometimes")
+
+class TestCommandGrouping(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.patcher = patch('focuscli.FILENAME', "test-plan.txt")
+        self.patcher.start()
+        self.cli = FocusCLI()
+
+    def tearDown(self):
+        # Closing saves the parse cache, which must land in the test directory
+        self.cli.ledger.close()
+        self.patcher.stop()
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_command_markers_written_together(self):
+        self.cli.mode = "FOCUS"
+        self.cli.triage_stack = [{'line': '[] Task 1', 'notes': []}]
+        with patch.object(self.cli.ledger, 'on_write', wraps=self.cli.ledger.on_write) as on_write:
+            self.cli.handle_command('x')
+
+        # Task Completed and Focus Session Complete go out in one write
+        on_write.assert_called_once()
+        data = on_write.call_args[0][1].decode('utf-8')
+        self.assertIn("Task Completed", data)
+        self.assertIn("Focus Session Complete", data)
+
+    def test_reads_inside_batch_see_unwritten_markers(self):
+        with self.cli.ledger.batch():
+            self.cli.commit_to_ledger("Triage", [{'line': '[] Task 1', 'notes': ['Note']}, {'line': '[x] Task 2', 'notes': []}])
+            self.assertEqual(self.cli._parse_file("test-plan.txt"), [{'line': '[] Task 1', 'notes': ['Note']}])
+            self.assertEqual(self.cli.get_daily_summary()['top']['[x]'], 1)
+            self.assertFalse(os.path.exists("test-plan.txt"))
+        self.assertEqual(self.cli._parse_file("test-plan.txt"), [{'line': '[] Task 1', 'notes': ['Note']}])
+
+    def test_sidecars_saved_once_per_command(self):
+        self.cli.commit_to_ledger("Triage", [{'line': '[] Task 1', 'notes': []}])
+        self.cli.triage_stack = self.cli._parse_file("test-plan.txt")
+        self.cli.mode = "FOCUS"
+        with patch.object(self.cli, '_save_parse_cache', wraps=self.cli._save_parse_cache) as save_cache, \
+                patch.object(self.cli, '_save_manifest', wraps=self.cli._save_manifest) as save_manifest:
+            self.cli.handle_command('x')
+        save_cache.assert_called_once()
+        save_manifest.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Ensure the root directory is in sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import ledgerio
+from migrate_ledger import migrate_file
+
+class TestLedgerIO(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "test-plan.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _lines(self, content, start=0):
+        with open(self.path, 'wb') as f:
+            f.write(content)
+        with open(self.path, 'rb') as f, ledgerio.mapped(f) as buf:
+            return list(ledgerio.iter_text_lines(buf, start))
+
+    def test_lines_match_split(self):
+        content = "[] Task ü  \n\n  Note\n------- Triage 01/01/2026 09:00:00 AM -------\nPartial".encode('utf-8')
+        # Markers are left undecoded
+        self.assertEqual(self._lines(content), ['[] Task ü', '', '  Note', b'------- Triage 01/01/2026 09:00:00 AM -------', 'Partial'])
+        self.assertEqual(self._lines(content, content.index(b"  Note")), ['  Note', b'------- Triage 01/01/2026 09:00:00 AM -------', 'Partial'])
+
+    def test_trailing_newline_and_empty_file(self):
+        self.assertEqual(self._lines(b"a\nb\n"), ['a', 'b'])
+        self.assertEqual(self._lines(b""), [])
+
+    def test_markers_found_without_decoding(self):
+        buf = b"[] Task\n------- Focus 01/01/2026 09:00:00 AM -------\n"
+        spans = list(ledgerio.iter_spans(buf))
+        self.assertEqual([ledgerio.is_marker(buf, s, e) for s, e in spans], [False, True])
+
+    def test_migrate_rewrites_only_markers(self):
+        content = "[] Task\n------- Work 01/01/2026 09:00:00 AM -------\n  Note -- kept\nNo newline"
+        with open(self.path, 'w') as f:
+            f.write(content)
+        migrate_file(self.path)
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), content.replace("Work", "Focus"))
+        with open(self.path + ".bak") as f:
+            self.assertEqual(f.read(), content)
+
+    def test_migrate_keeps_file_mode(self):
+        with open(self.path, 'w') as f:
+            f.write("------- Work 01/01/2026 09:00:00 AM -------\n")
+        os.chmod(self.path, 0o600)
+        migrate_file(self.path)
+
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+if __name__ == '__main__':
+    unittest.main()
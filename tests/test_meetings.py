@@ -8,7 +8,7 @@ import os
 # Ensure the root directory is in sys.path so we can import focuscli
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from focuscli import FocusCLI
+from focuscli import FocusCLI, parse_meeting_time, find_overlapping_meetings
 
 class TestMeetingInterruption(unittest.TestCase):
     def setUp(self):
@@ -97,5 +97,80 @@ class TestMeetingInterruption(unittest.TestCase):
         expected_task_start = (now - 300 - 600) + 300
         self.assertAlmostEqual(self.cli.task_start_time, expected_task_start)
 
+    def test_meeting_schedule_only_fires_at_deadlines(self):
+        now = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+        meeting_text = "[] Sync 10:30-11:00 AM"
+        self.cli.triage_stack = [{'line': '[] Task 1', 'notes': []}, {'line': meeting_text, 'notes': []}]
+        self.cli.mode = "FOCUS"
+        self.cli._evaluate_meetings = MagicMock(wraps=self.cli._evaluate_meetings)
+
+        with patch('focuscli.datetime') as mock_datetime:
+            for minute in [0, 5, 29]:
+                mock_datetime.now.return_value = now + timedelta(minutes=minute)
+                self.cli.check_meetings()
+            self.assertEqual(self.cli._evaluate_meetings.call_count, 1)
+            self.cli.play_chime.assert_not_called()
+
+            mock_datetime.now.return_value = now + timedelta(minutes=30)
+            self.cli.check_meetings()
+
+        self.assertEqual(self.cli.triage_stack[0]['line'], meeting_text)
+        self.cli.play_chime.assert_called_once()
+
+class TestMeetingTimeCache(unittest.TestCase):
+    def test_cached_result_follows_date_rollover(self):
+        line = "[] Standup 9:00-9:15 AM"
+        day1 = datetime(2026, 3, 2, 8, 0)
+        day2 = day1 + timedelta(days=1)
+
+        with patch('focuscli.datetime') as mock_datetime:
+            mock_datetime.now.return_value = day1
+            first = parse_meeting_time(line)
+            self.assertIs(parse_meeting_time(line), first)
+            self.assertEqual(first, (day1.replace(hour=9), day1.replace(hour=9, minute=15)))
+
+            mock_datetime.now.return_value = day2
+            self.assertEqual(parse_meeting_time(line)[0], day2.replace(hour=9))
+
+class TestMeetingOverlap(unittest.TestCase):
+    def test_find_overlapping_meetings(self):
+        base = datetime(2026, 3, 2, 9, 0)
+        def at(minutes):
+            return base + timedelta(minutes=minutes)
+
+        intervals = [
+            (at(0), at(60), 0),   # overlaps 1
+            (at(30), at(45), 1),
+            (at(60), at(90), 2),  # back-to-back with 0
+            (at(120), at(180), 3), # overlaps 4
+            (at(170), at(200), 4),
+        ]
+        self.assertEqual(find_overlapping_meetings(intervals), {0, 1, 3, 4})
+
+    def test_meeting_across_midnight_overlaps(self):
+        with patch('focuscli.FILENAME', 'test-plan.txt'):
+            cli = FocusCLI()
+        cli.triage_stack = [
+            {'line': '[] Late call 11:00 PM-1:00 AM', 'notes': []},
+            {'line': '[] Wrap-up 11:30 PM-11:45 PM', 'notes': []},
+            {'line': '[] Standup 9:00-9:15 AM', 'notes': []}
+        ]
+        meetings, overlaps = cli._get_meeting_layout()
+
+        self.assertEqual(meetings, {0, 1, 2})
+        self.assertEqual(overlaps, {0, 1})
+
+    def test_meeting_across_midnight_is_active_after_start(self):
+        with patch('focuscli.FILENAME', 'test-plan.txt'):
+            cli = FocusCLI()
+        cli.triage_stack = [
+            {'line': '[] Write report', 'notes': []},
+            {'line': '[] Late call 11:00 PM-1:00 AM', 'notes': []}
+        ]
+        with patch('focuscli.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 3, 2, 23, 30)
+            cli.sort_triage_stack()
+        self.assertEqual(cli.triage_stack[0]['line'], '[] Late call 11:00 PM-1:00 AM')
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@ import os
 import shutil
 import tempfile
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from focuscli import FocusCLI, DATE_FORMAT
 
 class TestRescueTask(unittest.TestCase):
@@ -84,6 +85,82 @@ class TestRescueTask(unittest.TestCase):
             idx2 = content.find("Task Day 2")
             self.assertTrue(idx1 < idx2)
 
+    def test_parallel_rescue_over_long_lookback(self):
+        today = datetime.now()
+        days_back = [25, 10, 3, 1]
+        for i in days_back:
+            with open(f"{(today - timedelta(days=i)).strftime(DATE_FORMAT)}-plan.txt", 'w') as f:
+                f.write(f"[] Task {i} days ago\n  [] Step {i}\n")
+
+        import focuscli
+        today_file = f"{today.strftime(DATE_FORMAT)}-plan.txt"
+        focuscli.FILENAME = today_file
+        with patch('focuscli.RESCUE_LOOKBACK_DAYS', 30), patch('focuscli.PARALLEL_MIN_FILES', 2):
+            self.cli.rescue_previous_tasks()
+
+        # Merged back oldest first
+        self.assertEqual([t['line'] for t in self.cli.triage_stack], [f"[] Task {i} days ago" for i in days_back])
+        with open(today_file, 'r') as f:
+            content = f.read()
+        self.assertEqual(content.count("Deferred from last session"), 1)
+        for i in days_back:
+            with open(f"{(today - timedelta(days=i)).strftime(DATE_FORMAT)}-plan.txt", 'r') as f:
+                self.assertIn(f"[>] Task {i} days ago\n  [>] Step {i}\n", f.read())
+
+    def test_manifest_skips_finished_files(self):
+        today = datetime.now()
+        today_file = f"{today.strftime(DATE_FORMAT)}-plan.txt"
+        done_file = f"{(today - timedelta(days=2)).strftime(DATE_FORMAT)}-plan.txt"
+        open_file = f"{(today - timedelta(days=1)).strftime(DATE_FORMAT)}-plan.txt"
+        with open(done_file, 'w') as f:
+            f.write("[x] Done\n")
+        with open(open_file, 'w') as f:
+            f.write("[] Open\n")
+
+        import focuscli
+        focuscli.FILENAME = today_file
+        self.cli.rescue_previous_tasks()
+        self.assertTrue(os.path.exists(focuscli.MANIFEST_NAME))
+
+        # Both files are finished now: the next session parses neither
+        other = FocusCLI()
+        with patch.object(other, '_parse_files', wraps=other._parse_files) as parse_files:
+            other.rescue_previous_tasks()
+        parse_files.assert_called_once_with([])
+
+        # A task appended later makes the file pending again
+        other.commit_to_ledger("Triage", [{'line': '[] Late', 'notes': []}], target_file=open_file)
+        other.ledger.flush()
+        self.assertFalse(FocusCLI()._is_known_finished(open_file))
+        self.assertTrue(FocusCLI()._is_known_finished(done_file))
+
+        # So does an edit outside the app
+        with open(done_file, 'a') as f:
+            f.write("[] Reopened\n")
+        self.assertFalse(FocusCLI()._is_known_finished(done_file))
+
+    def test_workers_leave_manifest_to_parent(self):
+        today = datetime.now()
+        paths = [f"{(today - timedelta(days=i)).strftime(DATE_FORMAT)}-plan.txt" for i in (2, 1)]
+        for i, path in enumerate(paths):
+            with open(path, 'w') as f:
+                f.write(f"[] Task {i}\n")
+
+        import focuscli
+        stack, entry = focuscli.parse_ledger_file(paths[0])
+        self.assertEqual(stack, [{'line': '[] Task 0', 'notes': []}])
+        self.assertTrue(entry['pending'])
+        self.assertFalse(os.path.exists(focuscli.MANIFEST_NAME))
+
+        cli = focuscli.FocusCLI()
+        with patch('focuscli.PARALLEL_MIN_FILES', 2), \
+                patch.object(cli, '_save_manifest', wraps=cli._save_manifest) as save_manifest:
+            self.assertEqual(len(cli._parse_files(paths)), 2)
+            cli.save_sidecars()
+        save_manifest.assert_called_once()
+        self.assertFalse(focuscli.FocusCLI()._is_known_finished(paths[1]))
+        self.assertIn(os.path.basename(paths[0]), focuscli.FocusCLI()._get_manifest(paths[0]))
+
     def test_defer_to_tomorrow_marker(self):
         today = datetime.now()
         tomorrow = today + timedelta(days=1)
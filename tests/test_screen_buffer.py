@@ -0,0 +1,64 @@
+import unittest
+import io
+import os
+import sys
+from unittest.mock import patch
+
+# Ensure the root directory is in sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import ScreenBuffer
+
+SIZE = os.terminal_size((80, 24))
+
+class TestScreenBuffer(unittest.TestCase):
+    def setUp(self):
+        self.screen = ScreenBuffer()
+        patcher = patch('focuscli.shutil.get_terminal_size', return_value=SIZE)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _present(self, text, cursor_col=0):
+        out = io.StringIO()
+        self.screen.write(text)
+        self.screen.present(out, cursor_col)
+        return out.getvalue()
+
+    def test_first_frame_is_full_redraw(self):
+        output = self._present("Header\nBody\n>> ")
+        self.assertTrue(output.startswith("\033[H\033[2J"))
+        self.assertIn("Header\nBody\n>> ", output)
+
+    def test_only_changed_lines_are_written(self):
+        self._present("Header\nBody\n>> ")
+        output = self._present("Header\nBody\n>> a", 4)
+
+        self.assertNotIn("\033[2J", output)
+        self.assertNotIn("Header", output)
+        self.assertNotIn("Body", output)
+        self.assertIn("\033[3;1H>> a", output)
+        self.assertTrue(output.endswith("\033[3;5H"))
+
+    def test_shrunk_frame_clears_below(self):
+        self._present("Header\nBody\nMore\n>> ")
+        output = self._present("Header\n>> ")
+        self.assertIn("\033[3;1H\033[J", output)
+
+    def test_invalidate_forces_full_redraw(self):
+        self._present("Header\n>> ")
+        self.screen.invalidate()
+        self.assertTrue(self._present("Header\n>> ").startswith("\033[H\033[2J"))
+
+    def test_patch_rows_skips_unchanged(self):
+        self._present("Timer 00:01\nBody\n>> ")
+        out = io.StringIO()
+        self.screen.patch_rows({0: "Timer 00:01"}, out)
+        self.assertEqual(out.getvalue(), "")
+
+        self.screen.patch_rows({0: "Timer 00:02"}, out)
+        self.assertEqual(out.getvalue(), "\033[s\033[1;1H\033[2KTimer 00:02\033[u")
+        # The patched row is now part of the known frame
+        self.assertNotIn("Timer", self._present("Timer 00:02\nBody\n>> "))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import os
+import shutil
+import tempfile
+import focuscli
+from focuscli import FocusCLI, parse_cli_args
+from searchindex import SearchIndex, format_hit, segment_path
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.old_filename = focuscli.FILENAME
+        focuscli.FILENAME = "20260102-plan.txt"
+        with open("20260101-plan.txt", "w") as f:
+            f.write("[] Project Apollo\n  [] Draft budget\n  Call with vendor\n")
+            f.write("\n------- Task Completed 01/01/2026 10:00:00 AM -------\n")
+            f.write("[] Project Apollo\n  [x] Draft budget\n")
+        with open(focuscli.FILENAME, "w") as f:
+            f.write("\n------- Free Write 01/02/2026 09:00:00 AM -------\n")
+            f.write("[] Review budget for Hermes\n")
+        self.cli = FocusCLI()
+
+    def tearDown(self):
+        focuscli.FILENAME = self.old_filename
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_hits_carry_file_timestamp_and_path(self):
+        hits = self.cli.search("BUDGET")
+        self.assertEqual(hits, [
+            ["20260102-plan.txt", "01/02/2026 09:00:00 AM", ["Review budget for Hermes"], "[] Review budget for Hermes"],
+            ["20260101-plan.txt", "01/01/2026 10:00:00 AM", ["Project Apollo", "Draft budget"], "[x] Draft budget"]
+        ])
+        self.assertEqual(self.cli.search("budget hermes"), hits[:1])
+        self.assertEqual(self.cli.search("vendor")[0][2], ["Project Apollo", "Call with vendor"])
+        self.assertEqual(self.cli.search("missing"), [])
+        self.assertEqual(format_hit(hits[1]), "20260101-plan.txt 01/01/2026 10:00:00 AM: Project Apollo > [x] Draft budget")
+
+    def test_commit_appends_are_indexed_without_rereading(self):
+        self.cli.search("budget")
+        self.cli.commit_to_ledger("Triage", [{'line': '[] Plan offsite', 'notes': ['Book venue']}])
+        self.cli.ledger.flush()
+
+        index = self.cli.search_index
+        self.assertEqual(index.files[focuscli.FILENAME]['offset'], os.path.getsize(focuscli.FILENAME))
+        index.update_file = None # Would raise if a file were read again
+        self.assertEqual(index.query("venue")[0][2], ["Plan offsite", "Book venue"])
+
+    def test_index_persists_and_catches_up(self):
+        self.cli.search("budget")
+        # Searching never writes the index
+        self.assertFalse(os.path.exists(segment_path(".", focuscli.FILENAME)))
+        self.cli.search_index.save()
+        self.assertTrue(os.path.exists(segment_path(".", focuscli.FILENAME)))
+        with open(focuscli.FILENAME, "a") as f:
+            f.write("[] Budget follow-up\n")
+
+        hits = FocusCLI().search("budget follow")
+        self.assertEqual([h[3] for h in hits], ["[] Budget follow-up"])
+
+    def test_save_writes_only_changed_segments(self):
+        self.cli.search("budget")
+        self.cli.search_index.save()
+        old_segment = segment_path(".", "20260101-plan.txt")
+        os.utime(old_segment, ns=(0, 0))
+
+        with open(focuscli.FILENAME, "a") as f:
+            f.write("[] Budget follow-up\n")
+        self.cli.search("budget")
+        self.cli.search_index.save()
+        self.assertEqual(os.stat(old_segment).st_mtime_ns, 0)
+
+        os.remove("20260101-plan.txt")
+        self.assertEqual([h[0] for h in self.cli.search("budget")], [focuscli.FILENAME] * 2)
+        self.cli.search_index.save()
+        self.assertFalse(os.path.exists(old_segment))
+
+    def test_rewritten_file_drops_stale_hits(self):
+        self.cli.search("budget")
+        with open("20260101-plan.txt", "w") as f:
+            f.write("[] Something else entirely\n")
+
+        self.assertEqual([h[0] for h in self.cli.search("budget")], [focuscli.FILENAME])
+        self.cli.search_index.save()
+        self.assertEqual(SearchIndex(self.test_dir).query("apollo"), [])
+
+    def test_query_command(self):
+        for mode in ["TRIAGE", "FOCUS"]:
+            self.cli.mode = mode
+            self.cli.handle_command("/budget")
+            self.assertEqual(self.cli.last_msg, "2 matches for 'budget'")
+            self.assertEqual(len(self.cli.search_results), 2)
+
+        self.cli.mode = "TRIAGE"
+        self.cli.handle_command("j")
+        self.assertEqual(self.cli.search_results, [])
+
+    def test_cli_args(self):
+        self.assertEqual(parse_cli_args(["--search", "budget", "plan.txt"]), ("plan.txt", {'search': 'budget'}))
+        self.assertEqual(parse_cli_args(["--search=a b"]), (None, {'search': 'a b'}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+
+# Ensure the root directory is in sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+class TestStackVersion(unittest.TestCase):
+    def setUp(self):
+        self.cli = FocusCLI()
+
+    def test_mutations_bump_stack_version(self):
+        self.cli.commit_to_ledger = lambda label, items: None
+        self.cli.triage_stack = [
+            {'line': '[] Task 1', 'notes': ['[] Sub 1', '[] Sub 2']},
+            {'line': '[] Task 2', 'notes': []},
+            {'line': 'Note A', 'notes': []}
+        ]
+        commands = [("TRIAGE", "p 1 0"), ("TRIAGE", "a 2 0"), ("TRIAGE", "i 1"),
+                    ("FOCUS", "x0"), ("FOCUS", "x"), ("FOCUS", 'n "[] Task 3"')]
+        for mode, cmd in commands:
+            self.cli.mode = mode
+            version = self.cli.stack_version
+            self.cli.handle_command(cmd)
+            self.assertFalse(self.cli.last_msg.startswith("Error"), cmd)
+            self.assertGreater(self.cli.stack_version, version, cmd)
+
+    def test_triage_commit_only_when_stack_changed(self):
+        commits = []
+        self.cli.commit_to_ledger = lambda label, items: commits.append((label, items))
+        self.cli.triage_stack = [{'line': '[] Task 1', 'notes': ['Note 1']}, {'line': '[] Task 2', 'notes': []}]
+        self.cli.initial_stack = self.cli._snapshot_stack()
+
+        self.cli.handle_command('w')
+        self.assertEqual(commits, [('Triage', [])])
+
+        # An in-place edit with an equal result is not a change
+        self.cli.mode = "TRIAGE"
+        self.cli._touch_stack(self.cli.triage_stack[0])
+        self.cli.triage_stack[0]['notes'][0] = 'Note ' + '1'
+        self.assertFalse(self.cli._stack_changed_since(self.cli.initial_stack))
+
+        # Reordering and restoring the order is not a change either
+        self.cli.handle_command('p 1 0')
+        self.cli.handle_command('p 1 0')
+        self.assertFalse(self.cli._stack_changed_since(self.cli.initial_stack))
+
+        self.cli._touch_stack(self.cli.triage_stack[1])
+        self.cli.triage_stack[1]['notes'].append('Note 2')
+        commits.clear()
+        self.cli.handle_command('w')
+        self.assertEqual(commits, [('Triage Checkpoint', self.cli.triage_stack)])
+        self.assertFalse(self.cli._stack_changed_since(self.cli.initial_stack))
+
+if __name__ == '__main__':
+    unittest.main()
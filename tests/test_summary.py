@@ -2,7 +2,9 @@ import unittest
 import os
 import shutil
 import tempfile
-from focuscli import FocusCLI
+from datetime import datetime
+from unittest.mock import patch
+from focuscli import FocusCLI, parse_date_range
 
 class TestSummary(unittest.TestCase):
     def setUp(self):
@@ -58,5 +60,48 @@ class TestSummary(unittest.TestCase):
         self.assertEqual(summary['top']['[>]'], 1)
         self.assertEqual(summary['sub']['[>]'], 1)
 
+    def test_summary_tracks_commits_and_external_appends(self):
+        with open("test-plan.txt", "w") as f:
+            f.write("[] Task 1\n")
+            f.write("  [] Subtask 1.1\n")
+        self.assertEqual(self.cli.get_daily_summary()['top']['[x]'], 0)
+
+        self.cli.commit_to_ledger("Task Completed", [{'line': '[] Task 1', 'notes': ['[x] Subtask 1.1']}])
+        summary = self.cli.get_daily_summary()
+        self.assertEqual(summary['top']['[x]'], 0)
+        self.assertEqual(summary['sub']['[x]'], 1)
+
+        # Appended outside the process (e.g. from vi)
+        with open("test-plan.txt", "a") as f:
+            f.write("[x] Task 1\n")
+        summary = self.cli.get_daily_summary()
+        self.assertEqual(summary['top']['[x]'], 1)
+
+        # Re-opening a resolved task takes it out of the counts again
+        self.cli.commit_to_ledger("Edited", [{'line': '[] Task 1', 'notes': []}])
+        self.assertEqual(self.cli.get_daily_summary()['top']['[x]'], 0)
+
+    def test_range_summary_adds_up_days(self):
+        days = {
+            "20260101-plan.txt": "[] Task A\n  [x] Step\n[x] Task A\n",
+            "20260102-plan.txt": "[] Task B\n[-] Task B\n",
+            "20260104-plan.txt": "[] Task C\n  [>] Step\n[>] Task C\n",
+            "20260105-plan.txt": "[x] Outside the range\n"
+        }
+        for name, content in days.items():
+            with open(name, "w") as f:
+                f.write(content)
+
+        start, end = parse_date_range("20260101..20260104")
+        expected = {'top': {'[x]': 1, '[-]': 1, '[>]': 1}, 'sub': {'[x]': 1, '[-]': 0, '[>]': 1}}
+        self.assertEqual(self.cli.get_range_summary(start, end), (expected, 3))
+        with patch('focuscli.PARALLEL_MIN_FILES', 2):
+            self.assertEqual(self.cli.get_range_summary(start, end), (expected, 3))
+
+    def test_parse_date_range(self):
+        self.assertEqual(parse_date_range("20260102"), (datetime(2026, 1, 2), datetime(2026, 1, 2)))
+        self.assertIsNone(parse_date_range("20260102..20260101"))
+        self.assertIsNone(parse_date_range("2026-01-01..20260102"))
+
 if __name__ == '__main__':
     unittest.main()
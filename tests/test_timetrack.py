@@ -0,0 +1,111 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+import focuscli
+import ledgerio
+from focuscli import FocusCLI
+from timetrack import TimeTracker, format_duration
+
+DAY = """
+------- Free Write 01/05/2026 09:00:00 AM -------
+[] Project A
+  [] Step 1
+  [] Step 2
+[] Project B
+
+------- Triage Session Started at 01/05/2026 09:01:00 AM -------
+
+------- Triage 01/05/2026 09:02:00 AM -------
+
+------- Task Started 01/05/2026 09:02:00 AM -------
+[] Project A
+  [] Step 1
+
+------- Break for 5 at 01/05/2026 09:20:00 AM -------
+
+------- Focus Session Re-started at 01/05/2026 09:25:00 AM -------
+
+------- Task Completed 01/05/2026 09:30:00 AM -------
+[] Project A
+  [x] Step 1
+
+------- Task Completed 01/05/2026 09:40:00 AM -------
+[] Project A
+  [x] Step 2
+
+------- Task Completed 01/05/2026 09:45:00 AM -------
+[x] Project A
+
+------- Task Started 01/05/2026 09:45:00 AM -------
+[] Project B
+
+------- Interrupted 01/05/2026 10:00:00 AM -------
+[] Project B
+
+------- Free Write 01/05/2026 11:00:00 AM -------
+
+------- Triage Session Started at 01/05/2026 11:00:00 AM -------
+
+------- Triage 01/05/2026 11:01:00 AM -------
+
+------- Task Started 01/05/2026 11:01:00 AM -------
+[] Project B
+"""
+
+class TestTimeTrack(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        with open("20260105-plan.txt", "w") as f:
+            f.write(DAY)
+        self.cli = FocusCLI()
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_intervals_per_task_path(self):
+        tracker = TimeTracker()
+        for line in ledgerio.iter_text_lines(DAY.encode('utf-8')):
+            tracker.feed(line)
+        # Breaks are left out, and the session still open at the end is not counted
+        self.assertEqual(tracker.finish(), {
+            "Project A > Step 1": 23 * 60,
+            "Project A > Step 2": 10 * 60,
+            "Project A": 5 * 60,
+            "Project B": 15 * 60
+        })
+        self.assertEqual(format_duration(3 * 3600 + 5 * 60 + 59), "3h 05m")
+
+    def test_range_uses_cache_until_file_changes(self):
+        with open("20260106-plan.txt", "w") as f:
+            f.write("------- Task Started 01/06/2026 09:00:00 AM -------\n[] Project B\n")
+            f.write("------- Focus Session Complete 01/06/2026 09:30:00 AM -------\n")
+        start, end = datetime(2026, 1, 4), datetime(2026, 1, 6)
+        totals, files = self.cli.get_focus_times(start, end)
+        self.assertEqual(files, 2)
+        self.assertEqual(totals["Project B"], 45 * 60)
+
+        with patch('timetrack.track_file', side_effect=AssertionError("file was reread")):
+            self.assertEqual(FocusCLI().get_focus_times(start, end), (totals, 2))
+
+        with open("20260106-plan.txt", "a") as f:
+            f.write("------- Task Started 01/06/2026 10:00:00 AM -------\n[] Project C\n")
+            f.write("------- Break for 5 at 01/06/2026 10:10:00 AM -------\n")
+        with patch('focuscli.PARALLEL_MIN_FILES', 1):
+            totals, _ = FocusCLI().get_focus_times(start, end)
+        self.assertEqual(totals["Project C"], 10 * 60)
+
+    def test_returning_to_focus_records_task_started(self):
+        self.cli.commit_to_ledger = lambda label, items: None
+        self.cli.triage_stack = [{'line': '[] Project A', 'notes': []}]
+        self.cli.last_recorded_focus = '[] Project A'
+        self.cli.handle_command('w')
+        self.assertIsNone(self.cli.last_recorded_focus)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import re
+import shutil
+import tempfile
+from unittest.mock import patch
+from focuscli import FocusCLI
+
+class TestTriageDelta(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.patcher = patch('focuscli.FILENAME', "test-plan.txt")
+        self.patcher.start()
+        with open("test-plan.txt", "w") as f:
+            for i in range(10):
+                f.write(f"[] Task {i}\n  Note {i}\n  [] Sub {i}\n")
+            f.write("Loose note\n")
+        self.cli = FocusCLI()
+        self.cli.load_context()
+        self.cli.initial_stack = self.cli._snapshot_stack()
+
+    def tearDown(self):
+        self.cli.ledger.close()
+        self.patcher.stop()
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def _tail(self):
+        with open("test-plan.txt") as f:
+            content = f.read()
+        return content[content.rindex("------- Triage"):]
+
+    def _triage(self, *cmds):
+        self.cli.mode = "TRIAGE"
+        for cmd in cmds:
+            self.cli.handle_command(cmd)
+        self.cli.handle_command("w")
+
+    def _assert_ledger_matches_stack(self):
+        self.assertEqual(FocusCLI()._parse_file("test-plan.txt"), self.cli.triage_stack)
+
+    def test_reorder_writes_only_moved_lines(self):
+        self._triage("p 9 0")
+
+        tail = self._tail()
+        self.assertIn("------- Triage Delta", tail)
+        # Task 9 moves in front of everything else, so the rest are relisted as bare lines
+        self.assertNotIn("Note 0", tail)
+        self._assert_ledger_matches_stack()
+
+    def test_unchanged_prefix_is_not_listed(self):
+        self._triage("a 10 9", "p 0 9")
+
+        tail = self._tail()
+        self.assertIn("------- Triage Delta", tail)
+        # The changed item is listed in full, the moved one as a bare line
+        self.assertTrue(tail.endswith("[] Task 9\n  Note 9\n  [] Sub 9\n  Loose note\n[] Task 0\n"))
+        self.assertNotIn("Task 5", tail)
+        self._assert_ledger_matches_stack()
+
+    def test_removed_items(self):
+        # Assigning a top-level task under another removes it from the stack without resolving it
+        self._triage("a 3 0")
+
+        with open("test-plan.txt") as f:
+            content = f.read()
+        self.assertIn("------- Triage Removed", content)
+        self._assert_ledger_matches_stack()
+
+        summary = FocusCLI().get_daily_summary()
+        self.assertEqual(sum(summary['top'].values()) + sum(summary['sub'].values()), 0)
+
+    def test_full_checkpoint_every_n_deltas(self):
+        with patch('focuscli.TRIAGE_CHECKPOINT_INTERVAL', 2):
+            labels = []
+            for _ in range(3):
+                self._triage("p 9 8")
+                labels.append(re.match(r'------- (.*?) \d', self._tail()).group(1))
+                self._assert_ledger_matches_stack()
+
+        self.assertEqual(labels, ["Triage Delta", "Triage Delta", "Triage Checkpoint"])
+
+    def test_unchanged_triage_does_not_restart_checkpoint_count(self):
+        with patch('focuscli.TRIAGE_CHECKPOINT_INTERVAL', 2):
+            labels = []
+            for _ in range(3):
+                self._triage("p 9 8")
+                labels.append(re.match(r'------- (.*?) \d', self._tail()).group(1))
+                # Focusing again without changes only writes a bare Triage marker
+                self._triage()
+                self.assertRegex(self._tail(), r'^------- Triage \d[^\n]* -------\n$')
+
+        self.assertEqual(labels, ["Triage Delta", "Triage Delta", "Triage Checkpoint"])
+
+    def test_stack_matching_ledger_is_not_recommitted(self):
+        self._triage("p 9 0")
+        size = os.path.getsize("test-plan.txt")
+
+        self.assertFalse(self.cli._commit_triage(self.cli.triage_stack))
+        self.assertEqual(os.path.getsize("test-plan.txt"), size)
+
+    def test_resolutions_are_counted_after_deltas(self):
+        self._triage("p 9 0")
+        self.cli.handle_command("x")
+        self._triage("p 5 0")
+
+        summary = FocusCLI().get_daily_summary()
+        self.assertEqual(summary['sub']['[x]'], 1)
+        self._assert_ledger_matches_stack()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import io
+import os
+import sys
+import contextlib
+from unittest.mock import patch
+
+# Ensure the root directory is in sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from focuscli import FocusCLI
+
+class TestTriageViewport(unittest.TestCase):
+    def setUp(self):
+        self.cli = FocusCLI()
+        self.cli.commit_to_ledger = lambda label, items: None
+        self.cli.triage_stack = [{'line': f"[] Task {i}", 'notes': [f"Note {i}.a", f"Note {i}.b"]} for i in range(200)]
+        patcher = patch('focuscli.shutil.get_terminal_size', return_value=os.terminal_size((200, 30)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _render(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.cli.render_triage()
+        return out.getvalue()
+
+    def test_only_visible_rows_are_rendered(self):
+        output = self._render()
+        self.assertLess(len(output.splitlines()), 30)
+        self.assertIn("0: ", output)
+        self.assertNotIn("199: ", output)
+        self.assertIn("more below", output)
+
+    def test_notes_are_collapsed_by_default(self):
+        output = self._render()
+        self.assertNotIn("Note 0.a", output)
+        self.assertIn("[+2]", output)
+
+        self.cli.handle_command("o0")
+        output = self._render()
+        self.assertIn("0.0: ", output)
+        self.assertIn("Note 0.b", output)
+        self.assertNotIn("Note 1.a", output)
+
+    def test_jump_keeps_absolute_indices(self):
+        self.cli.handle_command("j150")
+        output = self._render()
+        self.assertIn("150: ", output)
+        self.assertNotIn("\n0: ", output)
+        self.assertIn("150 more above", output)
+
+        # Indices on screen still address the whole stack
+        self.cli.handle_command("p 151 0")
+        self.assertEqual(self.cli.triage_stack[0]['line'], "[] Task 151")
+
+    def test_paging(self):
+        self._render()
+        page = self.cli.triage_page
+        self.cli.handle_command("d")
+        self.assertEqual(self.cli.triage_scroll, page)
+        self.cli.handle_command("u")
+        self.assertEqual(self.cli.triage_scroll, 0)
+
+    def test_scroll_is_clamped_after_stack_shrinks(self):
+        self.cli.handle_command("j199")
+        self.cli.triage_stack = self.cli.triage_stack[:10]
+        self.assertIn("9: ", self._render())
+        self.assertEqual(self.cli.triage_scroll, 9)
+
+if __name__ == '__main__':
+    unittest.main()
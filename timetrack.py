@@ -0,0 +1,178 @@
+"""Focused time per task, rebuilt from the timestamps of ledger markers.
+
+A focus interval opens at Task Started, or at Focus Session Re-started
+after a break, and closes at the next marker that ends focus: a break,
+triage, Free Write, an interruption, the end of the session, the next Task
+Started or the resolution of the task in focus. Each closed interval is
+credited to the task path that was in focus, keyed like the scorecard
+("Task > Subtask"). An interval still open at the end of a file is not
+counted.
+
+Totals are cached per plan file in .focus-times.json next to the files and
+reused while a file's size and modification time are unchanged.
+"""
+import json
+import os
+import re
+from datetime import datetime
+
+import ledgerio
+
+TIME_CACHE_NAME = ".focus-times.json"
+TIME_CACHE_VERSION = 1
+MARKER_LINE_RE = re.compile(r'^------- (.*) (\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2} [AP]M) -------$')
+TIMESTAMP_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+LINE_MARKER_RE = re.compile(r'^\[([xe\->\s]?)\]\s*')
+RESOLUTION_LABELS = {"Task Completed", "Task Cancelled", "Task Deferred", "Cancelled", "Deferred", "Meeting Auto-Completed"}
+STOP_LABELS = {"Focus Session Complete", "Triage Session Started at", "Free Write"}
+STOP_PREFIXES = ("Break for ", "Interrupted")
+
+def _block_items(lines):
+    """Splits the lines under a marker into top-level items of (path, state) per line."""
+    items = []
+    stack = []
+    for line in lines:
+        if not line.strip():
+            continue
+        level = (len(line) - len(line.lstrip())) // 2
+        if level == 0 or not items:
+            items.append([])
+            level = 0
+        del stack[level:]
+        while len(stack) < level:
+            stack.append("")
+        clean = line.strip()
+        m = LINE_MARKER_RE.match(clean)
+        stack.append(clean[m.end():].strip() if m else clean)
+        items[-1].append((tuple(stack), m.group(1).strip() if m else None))
+    return items
+
+class TimeTracker:
+    """Turns a stream of ledger lines into seconds of focus per task path."""
+
+    def __init__(self):
+        self.totals = {} # "Task > Subtask" -> seconds
+        self.current = None # Path of the task in focus
+        self.opened = None # When the open interval started
+        self.label = None # Marker whose lines are being collected
+        self.when = None
+        self.lines = []
+
+    def feed(self, line):
+        """Takes one line as yielded by ledgerio.iter_text_lines: bytes for a marker, str otherwise."""
+        if isinstance(line, bytes):
+            self._end_block()
+            m = MARKER_LINE_RE.match(line.decode('utf-8', 'replace').strip())
+            self.label, self.when = None, None
+            if m:
+                try:
+                    self.label, self.when = m.group(1), datetime.strptime(m.group(2), TIMESTAMP_FORMAT)
+                except ValueError:
+                    pass
+        elif self.label is not None:
+            self.lines.append(line)
+
+    def finish(self):
+        """Handles the last marker and returns the totals."""
+        self._end_block()
+        return self.totals
+
+    def _close(self, when, path=None):
+        if self.opened is None:
+            return
+        seconds = (when - self.opened).total_seconds()
+        if seconds > 0:
+            key = " > ".join(path or self.current)
+            self.totals[key] = self.totals.get(key, 0) + seconds
+        self.opened = None
+
+    def _end_block(self):
+        label, when, lines = self.label, self.when, self.lines
+        self.lines = []
+        if label is None:
+            return
+
+        if label == "Task Started":
+            items = _block_items(lines)
+            if not items:
+                return
+            # The focused item is the deepest pending task; its parents are listed above it
+            pending = [path for path, state in items[0] if state == ""]
+            self._close(when)
+            self.current = pending[-1] if pending else items[0][0][0]
+            self.opened = when
+        elif label == "Focus Session Re-started at":
+            if self.current and self.opened is None:
+                self.opened = when
+        elif label in STOP_LABELS or label.startswith(STOP_PREFIXES):
+            self._close(when)
+        elif label in RESOLUTION_LABELS or label.startswith("Deferred to "):
+            if not self.current:
+                return
+            for item in _block_items(lines):
+                resolved = [path for path, state in item if state in ('x', '-', '>')]
+                if not resolved or resolved[0][0] != self.current[0]:
+                    continue
+                # Only the focused item can be resolved while focusing, so the interval was spent on it
+                path = resolved[0]
+                was_open = self.opened is not None
+                self._close(when, path)
+                if len(path) == 1:
+                    self.current = None
+                else:
+                    # The next pending subtask takes focus; which one is not recorded
+                    self.current = path[:1]
+                    self.opened = when if was_open else None
+                break
+
+def track_file(filepath):
+    """Returns the focused seconds per task path recorded in one ledger."""
+    tracker = TimeTracker()
+    with open(filepath, 'rb') as f:
+        with ledgerio.mapped(f) as buf:
+            for line in ledgerio.iter_text_lines(buf):
+                tracker.feed(line)
+    return tracker.finish()
+
+class TimeCache:
+    """Per-file totals of track_file for the plan files of one directory."""
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, TIME_CACHE_NAME)
+        self.files = {} # file name -> {size, mtime, totals}
+        self.dirty = False
+        try:
+            with open(self.path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if cached.get('version') == TIME_CACHE_VERSION:
+            self.files = cached['files']
+
+    def get(self, name, st):
+        """Returns the cached totals for a file with stat result st, or None if stale."""
+        entry = self.files.get(name)
+        if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+            return entry['totals']
+        return None
+
+    def put(self, name, st, totals):
+        self.files[name] = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'totals': totals}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'version': TIME_CACHE_VERSION, 'files': self.files}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self.dirty = False
+
+def format_duration(seconds):
+    """Formats seconds as e.g. "1h 05m"."""
+    minutes = int(seconds) // 60
+    return f"{minutes // 60}h {minutes % 60:02d}m"